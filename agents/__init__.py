@@ -5,7 +5,7 @@ This package contains specialized agents for generating LinkedIn posts:
 - LinkAnalysisAgent: Analyzes and summarizes web links
 - ResearchAgent: Conducts topic research
 - PostCompositionAgent: Generates final posts with style matching
-- MultiAgentGenerator: Orchestrates the workflow using Strands workflow system
+- MultiAgentGenerator: Runs the agents in dependency order
 - FeedbackAgent: Analyzes and critiques generated posts for quality assurance
 """
 
@@ -9,323 +9,593 @@ readability, structure, and overall quality.
 
 import os
 import re
+import bisect
 import json
-from typing import Dict, List, Any, Optional
-from strands import Agent
+import time
+import asyncio
+import httpx
+from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
+from openai import AsyncOpenAI, OpenAI
 
+try:
+    import orjson  # Optional speedup (uv sync --extra speedups)
+except ImportError:
+    orjson = None
 
-class FeedbackAgent:
-    def __init__(self, model: str = None):
-        """Initialize the Feedback Agent for post analysis"""
-        
-        # Load environment variables
-        load_dotenv()
-        
-        # Get API key
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        if not self.openai_api_key:
-            raise Exception("OPENAI_API_KEY not found. Please set it in .env file.")
-        
-        # Use provided model or get from environment
-        self.model = model or os.getenv("FEEDBACK_MODEL", "gpt-4o-mini")
-        
-        # Initialize agent with OpenAI model
-        try:
-            from strands.models.openai import OpenAIModel
-            
-            openai_model = OpenAIModel(
-                client_args={"api_key": self.openai_api_key},
-                model_id=self.model,
-                params={"temperature": 0.2, "max_tokens": 3000}  # Lower temp for consistent analysis
-            )
-            
-            self.agent = Agent(
-                system_prompt="""You are an expert LinkedIn content analyst and writing critique specialist. Your job is to:
+from .feedback_schemas import ANALYSIS_SCHEMAS
+from .file_cache import read_text_cached
+from .json_extraction import extract_json_object
+from .logging_config import get_logger
+from .openai_client import openai_client_args
+from .response_cache import ResponseCache
 
-1. Analyze LinkedIn posts for alignment with original instructions and requirements
-2. Evaluate style guide compliance and consistency
-3. Assess readability, clarity, and accessibility for diverse audiences
-4. Review structural elements like length, paragraphing, and flow
-5. Identify repetition, redundancy, and areas for improvement
-6. Provide specific, actionable feedback for content enhancement
 
-Always provide structured, detailed analysis with specific examples and concrete recommendations.
-Focus on professional LinkedIn content standards and user engagement potential.""",
-                model=openai_model
-            )
-            
-            print("✅ Feedback Agent initialized")
-            print(f"🔍 Using model: {self.model}")
-            
-        except Exception as e:
-            raise Exception(f"Failed to initialize Feedback Agent: {e}")
-    
-    def load_content_files(self) -> Dict[str, str]:
-        """Load all required content files for analysis"""
-        
-        files = {
-            'generated_post': 'output/result.txt',
-            'instructions': 'input/instructions.txt', 
-            'style_guide': 'input/linkedin_style_prompt.txt'
-        }
-        
-        content = {}
-        
-        for key, filepath in files.items():
-            try:
-                if os.path.exists(filepath):
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content[key] = f.read().strip()
-                    print(f"✅ Loaded {key}: {len(content[key])} characters")
-                else:
-                    print(f"⚠️ File not found: {filepath}")
-                    content[key] = ""
-            except Exception as e:
-                print(f"❌ Error loading {key} from {filepath}: {e}")
-                content[key] = ""
-        
-        return content
-    
-    def analyze_instruction_alignment(self, post: str, instructions: str) -> Dict[str, Any]:
-        """Analyze how well the post aligns with original instructions"""
-        
-        analysis_prompt = f"""Analyze how well this LinkedIn post aligns with the original instructions.
+logger = get_logger(__name__)
+
+# Minimum scores for each grade/summary band, lowest band first
+_GRADE_THRESHOLDS = (5, 6, 7, 8, 9)
+_GRADES = ("D", "C", "C+", "B", "B+", "A")
+
+_SUMMARY_THRESHOLDS = (4, 6, 8)
+_SUMMARIES = (
+    "Poor LinkedIn post (Grade {grade}). Major revisions needed across instruction alignment, style, readability, and structure.",
+    "Fair LinkedIn post (Grade {grade}). Addresses basic requirements but needs significant improvements in multiple areas.",
+    "Good LinkedIn post (Grade {grade}). Generally meets requirements with some areas for improvement in style, structure, or alignment.",
+    "Excellent LinkedIn post (Grade {grade}). Strong alignment with instructions, good style compliance, and high readability. Minor refinements could enhance impact."
+)
+
+# Sampling settings for every analysis request, direct or through the Batch API.
+# Lower temperature for consistent analysis
+_ANALYSIS_PARAMS = {"temperature": 0.2, "max_tokens": 3000}
+
+# Collapses punctuation/whitespace runs when comparing recommendations
+_NON_WORD_RE = re.compile(r'\W+')
+
+# Shared opening block of every analysis prompt. It is identical across all four
+# dimensions and always comes first, so that the provider's automatic prompt-prefix
+# caching can reuse it between the requests.
+_ANALYSIS_CONTEXT_TEMPLATE = """GENERATED POST:
+{post}
 
 ORIGINAL INSTRUCTIONS:
 {instructions}
 
-GENERATED POST:
-{post}
+STYLE GUIDE:
+{style_guide}
+
+"""
+
+_INSTRUCTION_ALIGNMENT_TASK = """Analyze how well this LinkedIn post aligns with the original instructions.
 
 Provide a detailed JSON analysis:
 
-{{
+{
     "alignment_score": [1-10],
-    "topic_coverage": {{
+    "topic_coverage": {
         "main_themes_addressed": ["theme1", "theme2"],
         "missing_themes": ["missing1", "missing2"],
         "coverage_percentage": [0-100]
-    }},
-    "research_integration": {{
+    },
+    "research_integration": {
         "sources_referenced": ["source1", "source2"],
         "integration_quality": "excellent/good/fair/poor",
         "specific_examples": ["example1", "example2"]
-    }},
-    "argument_coherence": {{
+    },
+    "argument_coherence": {
         "main_argument_clarity": "excellent/good/fair/poor",
         "logical_flow": "excellent/good/fair/poor",
         "evidence_support": "strong/moderate/weak"
-    }},
+    },
     "key_strengths": ["strength1", "strength2"],
     "areas_for_improvement": ["improvement1", "improvement2"],
     "specific_recommendations": ["rec1", "rec2"]
-}}
+}
 
 Focus on concrete examples and specific alignment issues."""
-        
-        try:
-            response = self.agent(analysis_prompt)
-            content = response.content if hasattr(response, 'content') else str(response)
-            
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return self._create_fallback_analysis("instruction_alignment", content)
-                
-        except Exception as e:
-            print(f"⚠️ Error in instruction alignment analysis: {e}")
-            return self._create_fallback_analysis("instruction_alignment", str(e))
-    
-    def analyze_style_compliance(self, post: str, style_guide: str) -> Dict[str, Any]:
-        """Analyze compliance with the style guide"""
-        
-        analysis_prompt = f"""Analyze this LinkedIn post's compliance with the provided style guide.
-
-STYLE GUIDE:
-{style_guide}
 
-GENERATED POST:
-{post}
+_STYLE_COMPLIANCE_TASK = """Analyze this LinkedIn post's compliance with the provided style guide.
 
 Provide a detailed JSON analysis:
 
-{{
+{
     "style_score": [1-10],
-    "tone_analysis": {{
+    "tone_analysis": {
         "tone_match": "excellent/good/fair/poor",
         "professionalism": "excellent/good/fair/poor", 
         "conversational_quality": "excellent/good/fair/poor",
         "critical_voice": "strong/moderate/weak"
-    }},
-    "sentence_structure": {{
+    },
+    "sentence_structure": {
         "average_sentence_length": [number],
         "complexity_level": "appropriate/too_simple/too_complex",
         "variety_score": [1-10]
-    }},
-    "engagement_elements": {{
+    },
+    "engagement_elements": {
         "rhetorical_questions": [count],
         "personal_anecdotes": [count],
         "storytelling_devices": ["device1", "device2"],
         "engagement_effectiveness": "high/medium/low"
-    }},
-    "formatting": {{
+    },
+    "formatting": {
         "paragraph_structure": "excellent/good/fair/poor",
         "line_breaks": "appropriate/excessive/insufficient", 
         "hashtag_usage": "optimal/excessive/insufficient",
         "hashtag_relevance": "high/medium/low"
-    }},
+    },
     "style_strengths": ["strength1", "strength2"],
     "style_issues": ["issue1", "issue2"],
     "style_recommendations": ["rec1", "rec2"]
-}}
+}
 
 Analyze specific examples from the post."""
-        
-        try:
-            response = self.agent(analysis_prompt)
-            content = response.content if hasattr(response, 'content') else str(response)
-            
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return self._create_fallback_analysis("style_compliance", content)
-                
-        except Exception as e:
-            print(f"⚠️ Error in style compliance analysis: {e}")
-            return self._create_fallback_analysis("style_compliance", str(e))
-    
-    def analyze_readability(self, post: str) -> Dict[str, Any]:
-        """Analyze readability and accessibility"""
-        
-        analysis_prompt = f"""Analyze the readability and accessibility of this LinkedIn post.
 
-GENERATED POST:
-{post}
+_READABILITY_TASK = """Analyze the readability and accessibility of this LinkedIn post.
 
 Provide a detailed JSON analysis:
 
-{{
+{
     "readability_score": [1-10],
-    "language_clarity": {{
+    "language_clarity": {
         "sentence_clarity": "excellent/good/fair/poor",
         "word_choice": "excellent/good/fair/poor",
         "jargon_balance": "appropriate/too_technical/too_simple",
         "accessibility": "high/medium/low"
-    }},
-    "non_native_accessibility": {{
+    },
+    "non_native_accessibility": {
         "vocabulary_complexity": "appropriate/too_complex/too_simple",
         "sentence_structure_clarity": "clear/moderate/confusing",
         "cultural_references": "universal/region_specific/unclear"
-    }},
-    "flow_and_coherence": {{
+    },
+    "flow_and_coherence": {
         "logical_progression": "excellent/good/fair/poor",
         "transition_quality": "smooth/adequate/choppy",
         "idea_connectivity": "strong/moderate/weak"
-    }},
+    },
     "comprehension_barriers": ["barrier1", "barrier2"],
     "readability_strengths": ["strength1", "strength2"],
     "accessibility_improvements": ["improvement1", "improvement2"]
-}}
+}
 
 Focus on how easy it is for diverse audiences to understand and engage with the content."""
-        
-        try:
-            response = self.agent(analysis_prompt)
-            content = response.content if hasattr(response, 'content') else str(response)
-            
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return self._create_fallback_analysis("readability", content)
-                
-        except Exception as e:
-            print(f"⚠️ Error in readability analysis: {e}")
-            return self._create_fallback_analysis("readability", str(e))
-    
-    def analyze_structure(self, post: str) -> Dict[str, Any]:
-        """Analyze structural elements and organization"""
-        
-        analysis_prompt = f"""Analyze the structural elements of this LinkedIn post.
 
-GENERATED POST:
-{post}
+_STRUCTURE_TASK = """Analyze the structural elements of this LinkedIn post.
 
 Provide a detailed JSON analysis:
 
-{{
+{
     "structure_score": [1-10],
-    "length_analysis": {{
+    "length_analysis": {
         "character_count": [count],
         "word_count": [count],
         "optimal_for_linkedin": true/false,
         "length_assessment": "too_short/optimal/too_long"
-    }},
-    "paragraph_analysis": {{
+    },
+    "paragraph_analysis": {
         "paragraph_count": [count],
         "average_sentences_per_paragraph": [number],
         "paragraph_variety": "excellent/good/fair/poor",
         "balance_assessment": "well_balanced/uneven/monotonous"
-    }},
-    "repetition_check": {{
+    },
+    "repetition_check": {
         "content_repetition": "none/minimal/moderate/excessive",
         "word_repetition": "none/minimal/moderate/excessive",
         "idea_repetition": "none/minimal/moderate/excessive",
         "repetitive_elements": ["element1", "element2"]
-    }},
-    "structural_flow": {{
+    },
+    "structural_flow": {
         "opening_strength": "strong/adequate/weak",
         "body_development": "excellent/good/fair/poor",
         "conclusion_effectiveness": "strong/adequate/weak"
-    }},
+    },
     "structural_strengths": ["strength1", "strength2"],
     "structural_issues": ["issue1", "issue2"],
     "structural_recommendations": ["rec1", "rec2"]
-}}
+}
 
 Count actual characters, words, and paragraphs accurately."""
+
+# Analysis dimensions in report order: analysis_type -> (progress label, task prompt)
+_ANALYSIS_DIMENSIONS = {
+    "instruction_alignment": ("instruction alignment analysis", _INSTRUCTION_ALIGNMENT_TASK),
+    "style_compliance": ("style compliance analysis", _STYLE_COMPLIANCE_TASK),
+    "readability": ("readability analysis", _READABILITY_TASK),
+    "structure": ("structural analysis", _STRUCTURE_TASK)
+}
+
+
+class FeedbackAgent:
+    # Upper bound on analysis requests in flight at once, to stay within rate limits
+    MAX_CONCURRENT_ANALYSES = 4
+    # Seconds between status checks when waiting on an OpenAI Batch API job
+    BATCH_POLL_INTERVAL = 30
+    # Seconds allowed for one post's feedback when evaluating many posts at once
+    POST_FEEDBACK_TIMEOUT = 120
+    
+    def __init__(self, model: str = None, use_cache: bool = True):
+        """Initialize the Feedback Agent for post analysis
+        
+        Args:
+            model: Model to use for analysis (defaults to FEEDBACK_MODEL)
+            use_cache: Reuse previous responses for identical analysis prompts
+        """
         
+        # Load environment variables
+        load_dotenv()
+        
+        # Get API key
+        self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        if not self.openai_api_key:
+            raise Exception("OPENAI_API_KEY not found. Please set it in .env file.")
+        
+        # Use provided model or get from environment
+        self.model = model or os.getenv("FEEDBACK_MODEL", "gpt-4o-mini")
+        
+        # Analyses are close to deterministic (low temperature), so identical prompts can reuse responses
+        self.response_cache = ResponseCache() if use_cache else None
+        
+        self.system_prompt = """You are an expert LinkedIn content analyst and writing critique specialist. Your job is to:
+
+1. Analyze LinkedIn posts for alignment with original instructions and requirements
+2. Evaluate style guide compliance and consistency
+3. Assess readability, clarity, and accessibility for diverse audiences
+4. Review structural elements like length, paragraphing, and flow
+5. Identify repetition, redundancy, and areas for improvement
+6. Provide specific, actionable feedback for content enhancement
+
+Always provide structured, detailed analysis with specific examples and concrete recommendations.
+Focus on professional LinkedIn content standards and user engagement potential."""
+        
+        # Pooled HTTP client and OpenAI client for the async path, bound to the event loop they were created in
+        self._http_client = None
+        self._pooled_client = None
+        self._pool_loop = None
+        
+        # Initialize the OpenAI client
         try:
-            response = self.agent(analysis_prompt)
-            content = response.content if hasattr(response, 'content') else str(response)
+            self.client = OpenAI(**openai_client_args(self.openai_api_key))
+            
+            logger.info("✅ Feedback Agent initialized")
+            logger.info("🔍 Using model: %s", self.model)
             
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return self._create_fallback_analysis("structure", content)
-                
         except Exception as e:
-            print(f"⚠️ Error in structural analysis: {e}")
-            return self._create_fallback_analysis("structure", str(e))
+            raise Exception(f"Failed to initialize Feedback Agent: {e}")
+    
+    def _get_pooled_client(self) -> AsyncOpenAI:
+        """Async OpenAI client whose analyses share one keep-alive connection pool in the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._pool_loop is not loop:
+            # Connections can't be reused across event loops, so start a new pool for this one
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
+            )
+            self._pooled_client = AsyncOpenAI(**openai_client_args(self.openai_api_key, self._http_client))
+            self._pool_loop = loop
+        return self._pooled_client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client used by the async analysis path"""
+        if self._http_client:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._pooled_client = None
+        self._pool_loop = None
     
-    def generate_comprehensive_feedback(self, content: Dict[str, str]) -> Dict[str, Any]:
-        """Generate comprehensive feedback combining all analysis dimensions"""
+    def _analysis_request(self, analysis_type: str, prompt: str) -> Dict[str, Any]:
+        """Chat completion arguments for one analysis, with its schema as the response format"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "response_format": ANALYSIS_SCHEMAS[analysis_type],
+            **_ANALYSIS_PARAMS
+        }
+    
+    @staticmethod
+    def _parsed_analysis(completion) -> Dict[str, Any]:
+        """The schema-validated analysis from a structured output completion"""
+        message = completion.choices[0].message
+        if message.parsed is None:
+            raise ValueError(message.refusal or "No structured output in the response")
+        return message.parsed.model_dump()
+    
+    def load_content_files(self) -> Dict[str, str]:
+        """Load all required content files for analysis"""
         
-        print("🔍 Starting comprehensive feedback analysis...")
+        files = {
+            'generated_post': 'output/result.txt',
+            'instructions': 'input/instructions.txt', 
+            'style_guide': 'input/linkedin_style_prompt.txt'
+        }
         
-        # Perform individual analyses
-        instruction_analysis = self.analyze_instruction_alignment(
-            content['generated_post'], 
-            content['instructions']
-        )
-        print("✅ Instruction alignment analysis complete")
+        content = {}
         
-        style_analysis = self.analyze_style_compliance(
-            content['generated_post'], 
-            content['style_guide']
+        for key, filepath in files.items():
+            try:
+                if os.path.exists(filepath):
+                    content[key] = read_text_cached(filepath)
+                    logger.debug("✅ Loaded %s: %d characters", key, len(content[key]))
+                else:
+                    logger.warning("⚠️ File not found: %s", filepath)
+                    content[key] = ""
+            except Exception as e:
+                logger.error("❌ Error loading %s from %s: %s", key, filepath, e)
+                content[key] = ""
+        
+        return content
+    
+    def _analysis_context(self, post: str, instructions: str, style_guide: str) -> str:
+        """Build the shared opening block of every analysis prompt"""
+        return _ANALYSIS_CONTEXT_TEMPLATE.format(
+            post=post,
+            instructions=instructions or 'Not provided',
+            style_guide=style_guide or 'Not provided'
         )
-        print("✅ Style compliance analysis complete")
+    
+    def _analysis_prompt(self, analysis_type: str, post: str, instructions: str = "", style_guide: str = "") -> str:
+        """Build the prompt for one analysis dimension"""
+        _, task = _ANALYSIS_DIMENSIONS[analysis_type]
+        return self._analysis_context(post, instructions, style_guide) + task
+    
+    def _analyze(self, analysis_type: str, post: str, instructions: str = "", style_guide: str = "") -> Dict[str, Any]:
+        """Run a single analysis dimension against the post"""
+        prompt = self._analysis_prompt(analysis_type, post, instructions, style_guide)
+        return self._run_analysis(analysis_type, prompt)
+    
+    def analyze_instruction_alignment(self, post: str, instructions: str) -> Dict[str, Any]:
+        """Analyze how well the post aligns with original instructions"""
+        return self._analyze("instruction_alignment", post, instructions=instructions)
+    
+    def analyze_style_compliance(self, post: str, style_guide: str) -> Dict[str, Any]:
+        """Analyze compliance with the style guide"""
+        return self._analyze("style_compliance", post, style_guide=style_guide)
+    
+    def analyze_readability(self, post: str) -> Dict[str, Any]:
+        """Analyze readability and accessibility"""
+        return self._analyze("readability", post)
+    
+    def analyze_structure(self, post: str) -> Dict[str, Any]:
+        """Analyze structural elements and organization"""
+        return self._analyze("structure", post)
+    
+    def _cache_key(self, prompt: str) -> str:
+        """Cache key covering everything that determines an analysis response"""
+        return ResponseCache.make_key(self.model, self.system_prompt, prompt)
+    
+    def _get_cached_analysis(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Look up a previous analysis for this exact prompt"""
+        if not self.response_cache:
+            return None
+        cached = self.response_cache.get(self._cache_key(prompt))
+        return extract_json_object(cached) if cached is not None else None
+    
+    def _cache_analysis(self, prompt: str, analysis: Dict[str, Any]):
+        """Store a successfully parsed analysis for reuse"""
+        if self.response_cache:
+            serialized = orjson.dumps(analysis).decode('utf-8') if orjson else json.dumps(analysis)
+            self.response_cache.set(self._cache_key(prompt), serialized)
+    
+    def _run_analysis(self, analysis_type: str, prompt: str) -> Dict[str, Any]:
+        """Run a single analysis prompt through the shared agent"""
+        label, _ = _ANALYSIS_DIMENSIONS[analysis_type]
+        try:
+            analysis = self._get_cached_analysis(prompt)
+            if analysis is not None:
+                return analysis
+            
+            # Structured output enforces the analysis schema server-side
+            completion = self.client.beta.chat.completions.parse(**self._analysis_request(analysis_type, prompt))
+            analysis = self._parsed_analysis(completion)
+            self._cache_analysis(prompt, analysis)
+            return analysis
+                
+        except Exception as e:
+            logger.warning("⚠️ Error in %s: %s", label, e)
+            return self._create_fallback_analysis(analysis_type, str(e))
+    
+    async def _arun_analysis(self, analysis_type: str, prompt: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Run a single analysis prompt concurrently with the other dimensions"""
+        label, _ = _ANALYSIS_DIMENSIONS[analysis_type]
+        analysis = self._get_cached_analysis(prompt)
+        if analysis is not None:
+            logger.debug("♻️ %s loaded from cache", label.capitalize())
+            return analysis
+        
+        async with semaphore:
+            try:
+                client = self._get_pooled_client()
+                completion = await client.beta.chat.completions.parse(**self._analysis_request(analysis_type, prompt))
+                analysis = self._parsed_analysis(completion)
+                self._cache_analysis(prompt, analysis)
+                
+            except Exception as e:
+                logger.warning("⚠️ Error in %s: %s", label, e)
+                analysis = self._create_fallback_analysis(analysis_type, str(e))
         
-        readability_analysis = self.analyze_readability(content['generated_post'])
-        print("✅ Readability analysis complete")
+        logger.info("✅ %s complete", label.capitalize())
+        return analysis
+    
+    def _analysis_requests(self, content: Dict[str, str]) -> List[Tuple[str, str]]:
+        """Build the (analysis_type, prompt) pair for each analysis dimension"""
+        # Every prompt gets the full context so they all share the same cacheable prefix
+        context = self._analysis_context(content['generated_post'], content['instructions'], content['style_guide'])
+        return [(analysis_type, context + task) for analysis_type, (_, task) in _ANALYSIS_DIMENSIONS.items()]
+    
+    def _build_batch_requests(self, requests: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Build one OpenAI Batch API request line per (analysis_type, prompt) pair"""
+        from openai.lib._pydantic import to_strict_json_schema
+        
+        return [
+            {
+                "custom_id": analysis_type,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    **self._analysis_request(analysis_type, prompt),
+                    # Batch request bodies are plain JSON, so the schema is sent in the strict JSON
+                    # form that parse() derives from the same model for direct requests
+                    "response_format": {
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": analysis_type,
+                            "schema": to_strict_json_schema(ANALYSIS_SCHEMAS[analysis_type]),
+                            "strict": True
+                        }
+                    }
+                }
+            }
+            for analysis_type, prompt in requests
+        ]
+    
+    def _run_batch_analyses(self, content: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Submit all analyses as a single OpenAI Batch API job and wait for the results
+        
+        Batch jobs are billed at a discount but may take up to 24 hours to complete,
+        so this is only suitable for offline, dataset-scale feedback runs.
+        """
+        client = self.client
+        requests = self._analysis_requests(content)
+        
+        # Dimensions analyzed before are reused rather than submitted (and billed) again
+        analyses = {analysis_type: self._get_cached_analysis(prompt) for analysis_type, prompt in requests}
+        pending = [(analysis_type, prompt) for analysis_type, prompt in requests if analyses[analysis_type] is None]
+        if not pending:
+            logger.info("♻️ All analyses loaded from cache")
+            return list(analyses.values())
         
-        structure_analysis = self.analyze_structure(content['generated_post'])
-        print("✅ Structural analysis complete")
+        try:
+            batch_input = "\n".join(json.dumps(request) for request in self._build_batch_requests(pending))
+            input_file = client.files.create(
+                file=("feedback_batch.jsonl", batch_input.encode("utf-8")),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info("📦 Submitted feedback batch: %s", batch.id)
+            
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(self.BATCH_POLL_INTERVAL)
+                batch = client.batches.retrieve(batch.id)
+                logger.debug("⏳ Batch %s status: %s", batch.id, batch.status)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                raise Exception(f"Batch {batch.id} finished with status '{batch.status}'")
+            
+            # Route each output line back to its analysis by custom_id
+            responses = {}
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if line.strip():
+                    result = json.loads(line)
+                    responses[result["custom_id"]] = result
+                    
+        except Exception as e:
+            logger.warning("⚠️ Error in batch feedback analysis: %s", e)
+            for analysis_type, _ in pending:
+                analyses[analysis_type] = self._create_fallback_analysis(analysis_type, str(e))
+            return list(analyses.values())
+        
+        for analysis_type, prompt in pending:
+            try:
+                result = responses[analysis_type]
+                if result.get("error"):
+                    raise Exception(result["error"])
+                body = result["response"]["body"]
+                # Validate against the same schema the direct requests are parsed with
+                schema = ANALYSIS_SCHEMAS[analysis_type]
+                analysis = schema.model_validate_json(body["choices"][0]["message"]["content"]).model_dump()
+                self._cache_analysis(prompt, analysis)
+                analyses[analysis_type] = analysis
+            except Exception as e:
+                logger.warning("⚠️ Error in batch %s analysis: %s", analysis_type, e)
+                analyses[analysis_type] = self._create_fallback_analysis(analysis_type, str(e))
+        
+        return list(analyses.values())
+    
+    def generate_comprehensive_feedback(self, content: Dict[str, str], use_batch: bool = False) -> Dict[str, Any]:
+        """Generate comprehensive feedback combining all analysis dimensions
+        
+        Args:
+            content: Loaded content files (generated_post, instructions, style_guide)
+            use_batch: Submit the analyses as a single OpenAI Batch API job (cheaper, but
+                high latency) instead of running them concurrently
+        """
+        if not use_batch:
+            return self._run_async(self.agenerate_comprehensive_feedback(content))
+        
+        logger.info("🔍 Starting comprehensive feedback analysis (batch mode)...")
+        return self._compile_feedback(content, *self._run_batch_analyses(content))
+    
+    def generate_batch(self, posts: List[Dict[str, str]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Generate comprehensive feedback for many posts concurrently
+        
+        Args:
+            posts: Content dicts (generated_post, instructions, style_guide), one per post
+            max_concurrency: Maximum number of posts being analyzed at once
+            
+        Returns:
+            Feedback reports in the same order as posts
+        """
+        return self._run_async(self.agenerate_batch(posts, max_concurrency))
+    
+    def _run_async(self, coroutine):
+        """Run a coroutine to completion, closing the pooled client before its event loop goes away"""
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    async def agenerate_batch(self, posts: List[Dict[str, str]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """Generate feedback for many posts, bounding how many are in flight at once"""
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(index: int, content: Dict[str, str]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    # One slow post shouldn't hold up the tail of the batch
+                    return await asyncio.wait_for(
+                        self.agenerate_comprehensive_feedback(content), self.POST_FEEDBACK_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning("⚠️ Feedback for post %d timed out after %ss", index + 1, self.POST_FEEDBACK_TIMEOUT)
+                    error = "Analysis timed out"
+                    return self._compile_feedback(
+                        content, *(self._create_fallback_analysis(analysis_type, error) for analysis_type in _ANALYSIS_DIMENSIONS)
+                    )
+        
+        logger.info("🔍 Generating feedback for %d posts (up to %d at once)...", len(posts), max_concurrency)
+        # gather returns results in input order regardless of completion order
+        return await asyncio.gather(*(bounded(index, content) for index, content in enumerate(posts)))
+    
+    async def agenerate_comprehensive_feedback(self, content: Dict[str, str]) -> Dict[str, Any]:
+        """Generate comprehensive feedback, running the four analyses concurrently"""
+        
+        logger.info("🔍 Starting comprehensive feedback analysis...")
+        
+        # The four analyses are independent, so run them concurrently
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ANALYSES)
+        requests = self._analysis_requests(content)
+        results = await asyncio.gather(
+            *(self._arun_analysis(analysis_type, prompt, semaphore) for analysis_type, prompt in requests),
+            return_exceptions=True
+        )
+        
+        analyses = [
+            self._create_fallback_analysis(analysis_type, str(result)) if isinstance(result, BaseException) else result
+            for (analysis_type, _), result in zip(requests, results)
+        ]
+        return self._compile_feedback(content, *analyses)
+    
+    def _compile_feedback(self, content: Dict[str, str], instruction_analysis: Dict, style_analysis: Dict, readability_analysis: Dict, structure_analysis: Dict) -> Dict[str, Any]:
+        """Combine the individual analyses into the comprehensive feedback report"""
         
         # Calculate overall assessment
         scores = [
@@ -349,17 +619,22 @@ Count actual characters, words, and paragraphs accurately."""
             'readability_accessibility': readability_analysis,
             'structural_analysis': structure_analysis,
             'recommendations': self._compile_recommendations(instruction_analysis, style_analysis, readability_analysis, structure_analysis),
-            'post_metrics': {
-                'character_count': len(content['generated_post']),
-                'word_count': len(content['generated_post'].split()),
-                'paragraph_count': len([p for p in content['generated_post'].split('\n\n') if p.strip()]),
-                'reading_time_minutes': max(1, round(len(content['generated_post'].split()) / 200))
-            }
+            'post_metrics': self._post_metrics(content['generated_post'])
         }
         
-        print("✅ Comprehensive feedback analysis complete")
+        logger.info("✅ Comprehensive feedback analysis complete")
         return feedback
     
+    def _post_metrics(self, post: str) -> Dict[str, int]:
+        """Compute basic length metrics for the post, splitting it into words only once"""
+        word_count = len(post.split())
+        return {
+            'character_count': len(post),
+            'word_count': word_count,
+            'paragraph_count': sum(1 for paragraph in post.split('\n\n') if paragraph and not paragraph.isspace()),
+            'reading_time_minutes': max(1, round(word_count / 200))
+        }
+    
     def _create_fallback_analysis(self, analysis_type: str, content: str) -> Dict[str, Any]:
         """Create fallback analysis when JSON parsing fails"""
         return {
@@ -371,26 +646,14 @@ Count actual characters, words, and paragraphs accurately."""
     
     def _score_to_grade(self, score: float) -> str:
         """Convert numeric score to letter grade"""
-        if score >= 9: return "A"
-        elif score >= 8: return "B+"
-        elif score >= 7: return "B"
-        elif score >= 6: return "C+"
-        elif score >= 5: return "C"
-        else: return "D"
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, score)]
     
     def _generate_overall_summary(self, score: float, inst_analysis: Dict, style_analysis: Dict, read_analysis: Dict, struct_analysis: Dict) -> str:
         """Generate overall summary based on all analyses"""
         
         grade = self._score_to_grade(score)
-        
-        if score >= 8:
-            return f"Excellent LinkedIn post (Grade {grade}). Strong alignment with instructions, good style compliance, and high readability. Minor refinements could enhance impact."
-        elif score >= 6:
-            return f"Good LinkedIn post (Grade {grade}). Generally meets requirements with some areas for improvement in style, structure, or alignment."
-        elif score >= 4:
-            return f"Fair LinkedIn post (Grade {grade}). Addresses basic requirements but needs significant improvements in multiple areas."
-        else:
-            return f"Poor LinkedIn post (Grade {grade}). Major revisions needed across instruction alignment, style, readability, and structure."
+        summary = _SUMMARIES[bisect.bisect_right(_SUMMARY_THRESHOLDS, score)]
+        return summary.format(grade=grade)
     
     def _compile_recommendations(self, inst_analysis: Dict, style_analysis: Dict, read_analysis: Dict, struct_analysis: Dict) -> List[str]:
         """Compile top recommendations from all analyses"""
@@ -405,15 +668,20 @@ Count actual characters, words, and paragraphs accurately."""
                     if key in analysis and isinstance(analysis[key], list):
                         recommendations.extend(analysis[key][:2])  # Top 2 from each category
         
-        # Remove duplicates while preserving order
+        # Remove duplicates while preserving order, ignoring case and punctuation differences
         seen = set()
         unique_recommendations = []
         for rec in recommendations:
-            if isinstance(rec, str) and rec not in seen:
-                seen.add(rec)
+            if not isinstance(rec, str):
+                continue
+            normalized = _NON_WORD_RE.sub(' ', rec).strip().lower()
+            if normalized and normalized not in seen:
+                seen.add(normalized)
                 unique_recommendations.append(rec)
+                if len(unique_recommendations) == 8:  # Return top 8 recommendations
+                    break
         
-        return unique_recommendations[:8]  # Return top 8 recommendations
+        return unique_recommendations
 
 
 def main():
@@ -434,7 +702,10 @@ def main():
         print("\n" + "="*60)
         print("FEEDBACK ANALYSIS RESULTS")
         print("="*60)
-        print(json.dumps(feedback, indent=2))
+        if orjson:
+            print(orjson.dumps(feedback, option=orjson.OPT_INDENT_2).decode('utf-8'))
+        else:
+            print(json.dumps(feedback, indent=2))
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Feedback Schemas
+
+Pydantic models mirroring the JSON layout requested by each FeedbackAgent
+analysis prompt. They are passed to OpenAI structured outputs so the schema
+is enforced server-side instead of being scraped out of free-form text.
+"""
+
+from typing import Dict, List, Literal, Type
+from pydantic import BaseModel
+
+Quality = Literal["excellent", "good", "fair", "poor"]
+Strength = Literal["strong", "moderate", "weak"]
+Level = Literal["high", "medium", "low"]
+Amount = Literal["none", "minimal", "moderate", "excessive"]
+
+
+class TopicCoverage(BaseModel):
+    main_themes_addressed: List[str]
+    missing_themes: List[str]
+    coverage_percentage: int
+
+
+class ResearchIntegration(BaseModel):
+    sources_referenced: List[str]
+    integration_quality: Quality
+    specific_examples: List[str]
+
+
+class ArgumentCoherence(BaseModel):
+    main_argument_clarity: Quality
+    logical_flow: Quality
+    evidence_support: Strength
+
+
+class InstructionAlignment(BaseModel):
+    alignment_score: int
+    topic_coverage: TopicCoverage
+    research_integration: ResearchIntegration
+    argument_coherence: ArgumentCoherence
+    key_strengths: List[str]
+    areas_for_improvement: List[str]
+    specific_recommendations: List[str]
+
+
+class ToneAnalysis(BaseModel):
+    tone_match: Quality
+    professionalism: Quality
+    conversational_quality: Quality
+    critical_voice: Strength
+
+
+class SentenceStructure(BaseModel):
+    average_sentence_length: float
+    complexity_level: Literal["appropriate", "too_simple", "too_complex"]
+    variety_score: int
+
+
+class EngagementElements(BaseModel):
+    rhetorical_questions: int
+    personal_anecdotes: int
+    storytelling_devices: List[str]
+    engagement_effectiveness: Level
+
+
+class Formatting(BaseModel):
+    paragraph_structure: Quality
+    line_breaks: Literal["appropriate", "excessive", "insufficient"]
+    hashtag_usage: Literal["optimal", "excessive", "insufficient"]
+    hashtag_relevance: Level
+
+
+class StyleCompliance(BaseModel):
+    style_score: int
+    tone_analysis: ToneAnalysis
+    sentence_structure: SentenceStructure
+    engagement_elements: EngagementElements
+    formatting: Formatting
+    style_strengths: List[str]
+    style_issues: List[str]
+    style_recommendations: List[str]
+
+
+class LanguageClarity(BaseModel):
+    sentence_clarity: Quality
+    word_choice: Quality
+    jargon_balance: Literal["appropriate", "too_technical", "too_simple"]
+    accessibility: Level
+
+
+class NonNativeAccessibility(BaseModel):
+    vocabulary_complexity: Literal["appropriate", "too_complex", "too_simple"]
+    sentence_structure_clarity: Literal["clear", "moderate", "confusing"]
+    cultural_references: Literal["universal", "region_specific", "unclear"]
+
+
+class FlowAndCoherence(BaseModel):
+    logical_progression: Quality
+    transition_quality: Literal["smooth", "adequate", "choppy"]
+    idea_connectivity: Strength
+
+
+class Readability(BaseModel):
+    readability_score: int
+    language_clarity: LanguageClarity
+    non_native_accessibility: NonNativeAccessibility
+    flow_and_coherence: FlowAndCoherence
+    comprehension_barriers: List[str]
+    readability_strengths: List[str]
+    accessibility_improvements: List[str]
+
+
+class LengthAnalysis(BaseModel):
+    character_count: int
+    word_count: int
+    optimal_for_linkedin: bool
+    length_assessment: Literal["too_short", "optimal", "too_long"]
+
+
+class ParagraphAnalysis(BaseModel):
+    paragraph_count: int
+    average_sentences_per_paragraph: float
+    paragraph_variety: Quality
+    balance_assessment: Literal["well_balanced", "uneven", "monotonous"]
+
+
+class RepetitionCheck(BaseModel):
+    content_repetition: Amount
+    word_repetition: Amount
+    idea_repetition: Amount
+    repetitive_elements: List[str]
+
+
+class StructuralFlow(BaseModel):
+    opening_strength: Literal["strong", "adequate", "weak"]
+    body_development: Quality
+    conclusion_effectiveness: Literal["strong", "adequate", "weak"]
+
+
+class Structure(BaseModel):
+    structure_score: int
+    length_analysis: LengthAnalysis
+    paragraph_analysis: ParagraphAnalysis
+    repetition_check: RepetitionCheck
+    structural_flow: StructuralFlow
+    structural_strengths: List[str]
+    structural_issues: List[str]
+    structural_recommendations: List[str]
+
+
+# Output schema for each analysis type
+ANALYSIS_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "instruction_alignment": InstructionAlignment,
+    "style_compliance": StyleCompliance,
+    "readability": Readability,
+    "structure": Structure,
+}
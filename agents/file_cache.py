@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+File Cache
+
+Memoized reads of the small text inputs (instructions, base prompt, style guide) that
+several agents load on every run. Reads are keyed on the file's modification time, so
+an edited file is picked up on the next read without any explicit invalidation.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+
+@lru_cache(maxsize=32)
+def _read_text(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding='utf-8').strip()
+
+
+def read_text_cached(path: Union[str, Path]) -> str:
+    """Read and strip a text file, reusing the previous read while the file is unmodified"""
+    path = os.fspath(path)
+    return _read_text(path, os.stat(path).st_mtime_ns)
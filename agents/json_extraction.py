@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+JSON Extraction
+
+Helpers for pulling structured JSON out of free-form LLM responses, which
+often wrap the JSON in prose or markdown code fences.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+_decoder = json.JSONDecoder()
+
+
+def _extract_first(text: str, opener: str, kind: type) -> Optional[Any]:
+    """Decode in place from each occurrence of opener until a value of the given kind parses"""
+    start = text.find(opener)
+    while start != -1:
+        try:
+            value, _ = _decoder.raw_decode(text, start)
+            if isinstance(value, kind):
+                return value
+        except json.JSONDecodeError:
+            pass
+        start = text.find(opener, start + 1)
+    return None
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the first valid JSON object embedded in text, or None if there is none
+
+    Rather than matching from the first '{' to the last '}' with a DOTALL regex,
+    this decodes in place from each candidate '{' with the C-accelerated decoder
+    and stops at the end of the first object that parses.
+    """
+    return _extract_first(text, '{', dict)
+
+
+def extract_json_array(text: str) -> Optional[List[Any]]:
+    """Return the first valid JSON array embedded in text, or None if there is none"""
+    return _extract_first(text, '[', list)
@@ -6,25 +6,181 @@ Specialized agent for detecting and analyzing web links in LinkedIn post instruc
 Uses Tavily extraction via custom tool integration for clean, structured content.
 """
 
+import os
 import re
 import json
-from typing import List, Dict, Any
+import asyncio
+import httpx
+import urllib.parse
+from functools import lru_cache
+from collections import Counter
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
+from dotenv import load_dotenv
 from strands import Agent
 
+try:
+    import orjson  # Optional speedup (uv sync --extra speedups)
+except ImportError:
+    orjson = None
+
+try:
+    import re2  # Optional linear-time regex engine (uv sync --extra speedups)
+except ImportError:
+    re2 = None
+
+from .json_extraction import extract_json_object
+from .logging_config import get_logger
+from .openai_client import openai_client_args
+from .response_cache import ResponseCache
+from .token_counting import CHARS_PER_TOKEN, token_encoding
+
+# Load environment variables once, rather than on every agent or Tavily client construction
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# Top-level domains accepted for bare domains (no protocol or www), so tokens like
+# "file.txt", "e.g." or "Dr.Smith" aren't mistaken for links and sent off for analysis
+_COMMON_TLDS = (
+    'com', 'org', 'net', 'edu', 'gov', 'mil', 'int', 'io', 'ai', 'co', 'dev', 'app', 'info', 'biz',
+    'me', 'tv', 'news', 'blog', 'tech', 'xyz', 'us', 'uk', 'ca', 'au', 'nz', 'ie', 'de', 'fr', 'es',
+    'it', 'nl', 'be', 'at', 'ch', 'se', 'no', 'dk', 'fi', 'pl', 'pt', 'eu', 'in', 'jp', 'cn', 'kr',
+    'sg', 'br', 'mx', 'ru'
+)
+
+# Common URL patterns, combined into one alternation so the text is scanned once:
+# standard HTTP/HTTPS URLs, www URLs without protocol, and bare domains with a known TLD.
+# Instructions are arbitrary user text, so RE2 is used when available: it matches in
+# linear time and can't be driven into catastrophic backtracking. For the stdlib engine, bare
+# domains only start at a word boundary and labels are bounded (63 characters, as in RFC 1035),
+# so long runs of letters or dots can't make each start position rescan the rest of the text
+_URL_RE = (re2 or re).compile(
+    r'https?://\S+|www\.\S+|'
+    r'\b[a-zA-Z0-9][a-zA-Z0-9-]{0,62}(?:\.[a-zA-Z0-9][a-zA-Z0-9-]{0,62}){0,8}'
+    r'\.(?i:' + '|'.join(_COMMON_TLDS) + r')\b(?:[/:?#]\S*)?'
+)
+
+# Markdown noise in extracted page content that costs tokens without adding meaning
+_MARKDOWN_IMAGE_RE = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+_MARKDOWN_LINK_RE = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n\s*\n(?:\s*\n)+')
+
+# Bulleted lines and longer quoted passages in free-form analysis responses
+_BULLET_RE = re.compile(r'^[ \t]*[-•*][ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+_QUOTE_RE = re.compile(r'"([^"\n]{20,})"')
+
+# Static analysis instructions go before the page content in each prompt, so every request
+# starts with the same system prompt + instructions prefix that OpenAI can serve from its prompt cache
+_ANALYSIS_INSTRUCTIONS = """Please analyze the web content below and respond with a JSON object in exactly this structure:
+
+{
+    "title": "Page title or main heading",
+    "main_theme": "Primary topic or theme", 
+    "key_points": ["Key point 1", "Key point 2", "Key point 3"],
+    "relevant_quotes": ["Quote 1", "Quote 2"],
+    "supporting_data": ["Data point 1", "Data point 2"],
+    "linkedin_relevance": "How this could be used in LinkedIn posts",
+    "summary": "2-3 sentence summary"
+}
+
+Focus on extracting the most valuable information for LinkedIn content creation."""
+
+_BATCH_ANALYSIS_INSTRUCTIONS = """Please analyze each of the web documents below separately and respond with a JSON object in exactly this structure, with one entry per URL:
+
+{
+    "analyses": [
+        {
+            "url": "The document's URL, exactly as given",
+            "title": "Page title or main heading",
+            "main_theme": "Primary topic or theme", 
+            "key_points": ["Key point 1", "Key point 2", "Key point 3"],
+            "relevant_quotes": ["Quote 1", "Quote 2"],
+            "supporting_data": ["Data point 1", "Data point 2"],
+            "linkedin_relevance": "How this could be used in LinkedIn posts",
+            "summary": "2-3 sentence summary"
+        }
+    ]
+}
+
+Focus on extracting the most valuable information for LinkedIn content creation."""
+
+# URL keywords for each content theme, in priority order
+_URL_THEME_KEYWORDS = (
+    ("Artificial Intelligence", ('ai', 'artificial-intelligence', 'machine-learning', 'chatbot')),
+    ("Technology", ('tech', 'technology', 'innovation')),
+    ("Business", ('business', 'finance', 'economy')),
+    ("Health & Wellness", ('health', 'mental-health', 'psychology')),
+    ("Social Media Discussion", ('twitter.com', 'x.com')),
+    ("News & Current Events", ('news',)),
+)
+# One group per theme, so a single case-insensitive scan of the URL finds every theme keyword
+_URL_THEME_RE = re.compile(
+    '|'.join('(' + '|'.join(map(re.escape, keywords)) + ')' for _, keywords in _URL_THEME_KEYWORDS),
+    re.IGNORECASE
+)
+
+# Titles for well-known sites, by registered domain
+_DOMAIN_TITLES = {
+    'twitter.com': "Twitter/X Post",
+    'x.com': "Twitter/X Post",
+    'nytimes.com': "New York Times Article",
+    'linkedin.com': "LinkedIn Content",
+}
+
+# Key points for URLs that could not be fetched, by registered domain. Tuples are shared
+# across calls and copied into each fallback analysis
+_TWITTER_KEY_POINTS = (
+    "Social media post from Twitter/X platform",
+    "May contain opinions or breaking news",
+    "Could include viral content or trending topics"
+)
+_FALLBACK_BY_DOMAIN = {
+    'twitter.com': _TWITTER_KEY_POINTS,
+    'x.com': _TWITTER_KEY_POINTS,
+    'nytimes.com': (
+        "News article from The New York Times",
+        "Professional journalism and reporting",
+        "Likely contains in-depth analysis of current events"
+    ),
+    'linkedin.com': (
+        "Professional social media content",
+        "Business or career-related information",
+        "Professional networking context"
+    ),
+}
+
+
+@lru_cache(maxsize=4096)
+def _url_host(url: str) -> str:
+    """Return the URL's lowercase host without a www prefix, or '' if it can't be parsed"""
+    try:
+        host = urllib.parse.urlsplit(url).hostname or ''
+    except ValueError:
+        return ''
+    return host.removeprefix('www.')
+
+
+def _registered_domain(url: str) -> str:
+    """Return the URL's host without subdomains (e.g. 'mobile.twitter.com' -> 'twitter.com')"""
+    return '.'.join(_url_host(url).split('.')[-2:])
+
+
+@lru_cache(maxsize=4)
+def _shared_tavily_client(api_key: str):
+    """Tavily client, built once per API key and shared by all agents"""
+    from tavily import TavilyClient
+    return TavilyClient(api_key=api_key)
+
 
 def tavily_extract_tool():
     """Custom Tavily extraction tool for Strands agents"""
-    from tavily import TavilyClient
-    import os
-    from dotenv import load_dotenv
-    
-    load_dotenv()
     tavily_api_key = os.getenv("TAVILY_API_KEY")
     
     if not tavily_api_key:
         raise Exception("TAVILY_API_KEY not found in environment")
     
-    client = TavilyClient(api_key=tavily_api_key)
+    client = _shared_tavily_client(tavily_api_key)
     
     def extract_content(urls: List[str]) -> Dict[str, Any]:
         """Extract clean content from URLs using Tavily"""
@@ -38,65 +194,162 @@ def tavily_extract_tool():
 
 
 class LinkAnalysisAgent:
-    def __init__(self, openai_api_key: str = None, model: str = None):
-        """Initialize the Link Analysis Agent with Tavily content extraction"""
+    # Upper bound on analysis requests in flight at once, to avoid hammering the APIs
+    MAX_CONCURRENT_ANALYSES = 8
+    # URLs sent to Tavily in one extract request (the API limit is 20)
+    MAX_URLS_PER_EXTRACT = 20
+    # URLs analyzed together in one LLM call, and tokens of content sent for each of them
+    MAX_URLS_PER_BATCH = 5
+    BATCH_CONTENT_TOKENS = 1000
+    # Tokens of content sent when a URL is analyzed on its own
+    MAX_CONTENT_TOKENS = 2000
+    # Characters of a page title sent to the model
+    MAX_TITLE_LENGTH = 200
+    # Only this much of the instructions is scanned for links, bounding detection time on huge inputs
+    MAX_INSTRUCTIONS_SCAN_LENGTH = 200_000
+    # Seconds a cached URL analysis stays valid, since pages change over time
+    CACHE_TTL = 24 * 60 * 60
+    # Bump when the analysis prompt changes so older cached analyses are not reused
+    ANALYSIS_PROMPT_VERSION = "3"
+    
+    def __init__(self, openai_api_key: str = None, model: str = None, use_cache: bool = True,
+                 http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize the Link Analysis Agent with Tavily content extraction
+        
+        Args:
+            openai_api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            model: Model to use (defaults to the agent's model environment variable)
+            use_cache: Reuse results from previous runs
+            http_client: Connection pool shared with other agents; its owner closes it
+        """
         
         # Use provided API key or get from environment
         if openai_api_key:
             self.openai_api_key = openai_api_key
         else:
-            import os
-            from dotenv import load_dotenv
-            load_dotenv()
             self.openai_api_key = os.getenv("OPENAI_API_KEY")
         
         # Use provided model or get from environment
         if model:
             self.model = model
         else:
-            import os
-            from dotenv import load_dotenv
-            load_dotenv()
             self.model = os.getenv("LINK_ANALYSIS_MODEL", "gpt-4o-mini")
         
         if not self.openai_api_key:
             raise Exception("OPENAI_API_KEY not found. Please set it in .env file or pass it directly.")
         
+        # Successful analyses are reused across runs instead of re-fetching and re-analyzing the URL
+        self.response_cache = ResponseCache() if use_cache else None
+        
         # Initialize Tavily extraction tool
         try:
             self.tavily_extract = tavily_extract_tool()
-            print("✅ Tavily extraction tool initialized")
+            logger.info("✅ Tavily extraction tool initialized")
         except Exception as e:
-            print(f"⚠️ Tavily extraction tool failed to initialize: {e}")
+            logger.warning("⚠️ Tavily extraction tool failed to initialize: %s", e)
             self.tavily_extract = None
         
-        # Initialize agent with OpenAI model
-        try:
-            from strands.models.openai import OpenAIModel
-            
-            openai_model = OpenAIModel(
-                client_args={"api_key": self.openai_api_key},
-                model_id=self.model,
-                params={"temperature": 0.3, "max_tokens": 2000}
-            )
-            
-            self.agent = Agent(
-                system_prompt="""You are a web content analysis specialist. Your job is to:
+        # Pooled HTTP client and model for the async path, bound to the event loop they were created in
+        self._shared_http_client = http_client
+        self._http_client = None
+        self._pooled_model = None
+        self._pooled_batch_model = None
+        self._pool_loop = None
+        
+        self.system_prompt = """You are a web content analysis specialist. Your job is to:
 1. Analyze clean, structured content extracted from web pages
 2. Identify main themes and important points
 3. Find relevant quotes that support LinkedIn post arguments  
 4. Summarize content in a structured, actionable format
 5. Focus on information that would be valuable for LinkedIn content creation
 
-You will receive extracted web content and should provide structured analysis with key points, themes, and relevant quotes.""",
-                model=openai_model
+You will receive extracted web content and should provide structured analysis with key points, themes, and relevant quotes.
+Always respond with a single JSON object following the structure requested in the prompt."""
+        
+        logger.info("✅ Link Analysis Agent initialized with OpenAI API and Tavily extraction")
+        logger.info("🔗 Using model: %s", self.model)
+    
+    def _create_model(self, http_client: Optional[httpx.AsyncClient] = None, max_tokens: int = 2000):
+        """Create the OpenAI model used for content analysis"""
+        from strands.models.openai import OpenAIModel
+        
+        return OpenAIModel(
+            client_args=openai_client_args(self.openai_api_key, http_client),
+            model_id=self.model,
+            # JSON mode guarantees a parseable object, so responses don't need to be scraped for JSON
+            params={"temperature": 0.3, "max_tokens": max_tokens, "response_format": {"type": "json_object"}}
+        )
+    
+    def _create_agent(self, model) -> Agent:
+        """Create an agent with a fresh conversation on the given OpenAI model"""
+        # No callback handler: concurrent calls would otherwise interleave their streamed output on stdout
+        return Agent(system_prompt=self.system_prompt, model=model, callback_handler=None)
+    
+    def _get_pooled_model(self):
+        """Model whose requests share one keep-alive connection pool in the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._pool_loop is not loop:
+            # Connections can't be reused across event loops, so start a new pool for this one
+            self._http_client = self._shared_http_client or httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
             )
-            
-            print("✅ Link Analysis Agent initialized with OpenAI API and Tavily extraction")
-            print(f"🔗 Using model: {self.model}")
-            
-        except Exception as e:
-            raise Exception(f"Failed to initialize Link Analysis Agent: {e}")
+            self._pooled_model = self._create_model(http_client=self._http_client)
+            self._pooled_batch_model = None
+            self._pool_loop = loop
+        return self._pooled_model
+    
+    def _get_pooled_batch_model(self):
+        """Pooled model with an output budget large enough for a full batch of URLs"""
+        self._get_pooled_model()
+        if self._pooled_batch_model is None:
+            self._pooled_batch_model = self._create_model(
+                self._http_client, max_tokens=2000 * self.MAX_URLS_PER_BATCH
+            )
+        return self._pooled_batch_model
+    
+    async def aclose(self):
+        """Close the pooled HTTP client used by the async analysis path (a shared one is left to its owner)"""
+        if self._http_client and self._http_client is not self._shared_http_client:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._pooled_model = None
+        self._pooled_batch_model = None
+        self._pool_loop = None
+    
+    def _run_async(self, coroutine):
+        """Run a coroutine to completion, closing the pooled client before its event loop goes away"""
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    def _cache_key(self, url: str) -> str:
+        """Cache key covering everything that determines a URL's analysis"""
+        # Keyed by canonical form, so variants of a URL seen in earlier runs share one analysis
+        return ResponseCache.make_key(
+            "link_analysis", self.ANALYSIS_PROMPT_VERSION, self.model, self.system_prompt, self._canonical_url(url)
+        )
+    
+    def _get_cached_analysis(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a still-fresh cached analysis for a URL, if there is one"""
+        if not self.response_cache:
+            return None
+        cached = self.response_cache.get(self._cache_key(url), max_age=self.CACHE_TTL)
+        if cached is None:
+            return None
+        analysis = orjson.loads(cached) if orjson else json.loads(cached)
+        # May have been cached under a different variant of the same URL
+        analysis['url'] = url
+        return analysis
+    
+    def _cache_analysis(self, url: str, analysis: Dict[str, Any]):
+        """Store a successful analysis for later runs"""
+        if self.response_cache:
+            serialized = orjson.dumps(analysis).decode('utf-8') if orjson else json.dumps(analysis)
+            self.response_cache.set(self._cache_key(url), serialized)
     
     def detect_links(self, instructions: str) -> List[str]:
         """
@@ -108,166 +361,271 @@ You will receive extracted web content and should provide structured analysis wi
         Returns:
             List of URLs found in the instructions
         """
-        # Common URL patterns
-        url_patterns = [
-            r'https?://[^\s]+',  # Standard HTTP/HTTPS URLs
-            r'www\.[^\s]+',      # www URLs without protocol
-            r'[a-zA-Z0-9-]+\.[a-zA-Z]{2,}[^\s]*'  # Domain-like patterns
-        ]
-        
-        urls = []
-        for pattern in url_patterns:
-            matches = re.findall(pattern, instructions)
-            urls.extend(matches)
-        
-        # Clean and validate URLs
-        cleaned_urls = []
-        for url in urls:
-            # Add protocol if missing
+        # Every URL that survives validation contains a dot, so text without one can't contain
+        # any and the regex scan can be skipped (a C-level substring check)
+        if '.' not in instructions:
+            logger.info("🔗 Found 0 URLs in instructions")
+            return []
+        
+        # Clean and validate matches as they are found, collecting them in an insertion-ordered
+        # dict keyed by canonical form, so each page is only fetched and analyzed once
+        found = {}
+        for match in _URL_RE.finditer(instructions[:self.MAX_INSTRUCTIONS_SCAN_LENGTH]):
+            url = match.group()
+            
+            # Add protocol if missing (www and domain-like matches always contain a dot)
             if not url.startswith(('http://', 'https://')):
-                if url.startswith('www.'):
-                    url = 'https://' + url
-                elif '.' in url:
-                    url = 'https://' + url
+                url = 'https://' + url
             
             # Remove trailing punctuation
-            url = re.sub(r'[.,;!?]+$', '', url)
+            url = url.rstrip('.,;!?')
             
-            # Basic validation
-            if '.' in url and len(url) > 10:
-                cleaned_urls.append(url)
+            # Structural validation: the URL must parse and name a dotted host (e.g. not "https://foo./")
+            host = _url_host(url)
+            if '.' in host.strip('.') and len(host) >= 4:
+                found.setdefault(self._canonical_url(url), url)
         
-        # Remove duplicates while preserving order
-        unique_urls = list(dict.fromkeys(cleaned_urls))
+        unique_urls = list(found.values())
         
-        print(f"🔗 Found {len(unique_urls)} URLs in instructions:")
+        logger.info("🔗 Found %d URLs in instructions:", len(unique_urls))
         for url in unique_urls:
-            print(f"   - {url}")
+            logger.info("   - %s", url)
             
         return unique_urls
     
-    def fetch_and_analyze_content(self, url: str) -> Dict[str, Any]:
+    def fetch_and_analyze_content(self, url: str, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Fetch web content using Tavily extraction and analyze it for key information
         
         Args:
             url: The URL to fetch and analyze
+            bypass_cache: Re-fetch and re-analyze even if a cached analysis exists
             
         Returns:
             Dictionary containing analysis results
         """
-        try:
-            print(f"🌐 Extracting clean content from: {url}")
+        return self._run_async(self.afetch_and_analyze_content(url, bypass_cache))
+    
+    async def afetch_and_analyze_content(self, url: str, bypass_cache: bool = False) -> Dict[str, Any]:
+        """Async version of fetch_and_analyze_content, so many URLs can be analyzed concurrently"""
+        if not bypass_cache:
+            cached = self._get_cached_analysis(url)
+            if cached:
+                logger.debug("♻️ Using cached analysis for %s", url)
+                return cached
+        
+        extracted = (await self._aextract_contents([url]))[url]
+        if 'error' in extracted:
+            return self._create_fallback_analysis(url, extracted['error'])
+        
+        return await self._aanalyze_content(url, extracted['title'], extracted['content'])
+    
+    async def _aextract_contents(self, urls: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Extract clean content for several URLs, sending them to Tavily together
+        
+        Args:
+            urls: The URLs to extract
             
-            # Use Tavily to extract clean, structured content
-            if not self.tavily_extract:
-                print(f"⚠️ Tavily extraction not available, using fallback for {url}")
-                return self._create_fallback_analysis(url, "Tavily extraction not available")
+        Returns:
+            Mapping of each URL to its extracted 'title' and 'content', or to an 'error'
+        """
+        for url in urls:
+            logger.debug("🌐 Extracting clean content from: %s", url)
+        
+        # Use Tavily to extract clean, structured content
+        if not self.tavily_extract:
+            logger.warning("⚠️ Tavily extraction not available, using fallback")
+            return {url: {'error': "Tavily extraction not available"} for url in urls}
+        
+        # Extract content using Tavily - this gets clean, structured content without noise.
+        # Tavily accepts several URLs per request, so one round-trip covers a whole chunk of URLs
+        chunks = [urls[i:i + self.MAX_URLS_PER_EXTRACT] for i in range(0, len(urls), self.MAX_URLS_PER_EXTRACT)]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.tavily_extract, chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        extracted = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                logger.warning("⚠️ Tavily extraction failed: %s", result)
+                extracted.update({url: {'error': f"Tavily extraction failed: {result}"} for url in chunk})
+                continue
             
-            try:
-                # Extract content using Tavily - this gets clean, structured content without noise
-                extraction_result = self.tavily_extract([url])
+            items = (result or {}).get('results') or []
+            items_by_url = {item.get('url'): item for item in items}
+            for url in chunk:
+                extracted_data = items_by_url.get(url)
+                if extracted_data is None and len(chunk) == 1 and items:
+                    # Tavily may report a single URL in normalized form
+                    extracted_data = items[0]
                 
-                if not extraction_result or 'results' not in extraction_result or not extraction_result['results']:
-                    print(f"⚠️ No content extracted from {url}")
-                    return self._create_fallback_analysis(url, "No content extracted")
-                
-                # Get the extracted content
-                extracted_data = extraction_result['results'][0]
-                extracted_content = extracted_data.get('raw_content', '') or extracted_data.get('content', '')
-                extracted_title = extracted_data.get('title', '') or self._extract_title_from_url(url)
+                if not extracted_data:
+                    logger.warning("⚠️ No content extracted from %s", url)
+                    extracted[url] = {'error': "No content extracted"}
+                    continue
                 
+                # Get the extracted content, stripped of markup the model doesn't need
+                extracted_content = self._clean_content(
+                    extracted_data.get('raw_content', '') or extracted_data.get('content', '')
+                )
                 if not extracted_content or len(extracted_content) < 50:
-                    print(f"⚠️ Minimal content extracted from {url}")
-                    return self._create_fallback_analysis(url, "Minimal content extracted")
-                
-                print(f"✅ Extracted {len(extracted_content)} characters of clean content")
+                    logger.warning("⚠️ Minimal content extracted from %s", url)
+                    extracted[url] = {'error': "Minimal content extracted"}
+                    continue
                 
-                # Truncate content if too long to avoid context window issues
-                max_content_length = 8000  # Conservative limit for analysis
-                if len(extracted_content) > max_content_length:
-                    extracted_content = extracted_content[:max_content_length] + "\n\n[Content truncated to avoid token limits...]"
-                    print(f"⚠️ Content truncated to {max_content_length} characters")
-                
-            except Exception as e:
-                print(f"⚠️ Tavily extraction failed for {url}: {e}")
-                return self._create_fallback_analysis(url, f"Tavily extraction failed: {e}")
+                logger.debug("✅ Extracted %d characters of clean content from %s", len(extracted_content), url)
+                extracted[url] = {
+                    # Page titles are occasionally whole paragraphs of scraped text, so they are bounded too
+                    'title': (extracted_data.get('title', '') or self._extract_title_from_url(url))[:self.MAX_TITLE_LENGTH],
+                    'content': extracted_content
+                }
+        
+        return extracted
+    
+    def _clean_content(self, content: str) -> str:
+        """Strip markdown images and link targets and collapse blank lines, so the length limit is spent on text"""
+        content = _MARKDOWN_IMAGE_RE.sub('', content)
+        content = _MARKDOWN_LINK_RE.sub(r'\1', content)
+        return _EXCESS_BLANK_LINES_RE.sub('\n\n', content).strip()
+    
+    def _truncate_content(self, content: str, max_tokens: int) -> str:
+        """Truncate extracted content to a token budget to avoid context window issues"""
+        # Every token covers at least one character, so short content can't be over budget
+        if len(content) <= max_tokens:
+            return content
+        
+        encoding = token_encoding(self.model)
+        if encoding is None:
+            max_length = max_tokens * CHARS_PER_TOKEN
+            if len(content) <= max_length:
+                return content
+            truncated = content[:max_length]
+        else:
+            # Tokens rarely span more than a few characters, so very long pages are cut before encoding
+            tokens = encoding.encode_ordinary(content[:max_tokens * 10])
+            if len(tokens) <= max_tokens and len(content) <= max_tokens * 10:
+                return content
+            truncated = encoding.decode(tokens[:max_tokens])
+        
+        logger.debug("⚠️ Content truncated to %d tokens", max_tokens)
+        return truncated + "\n\n[Content truncated to avoid token limits...]"
+    
+    def _response_text(self, response) -> str:
+        """Extract content from an agent response"""
+        if hasattr(response, 'content'):
+            return response.content
+        return str(response)
+    
+    def _parse_json(self, content: str) -> Any:
+        """Parse JSON text, raising json.JSONDecodeError (which orjson's error subclasses) on failure"""
+        try:
+            return orjson.loads(content) if orjson else json.loads(content)
+        except json.JSONDecodeError:
+            # e.g. a model that ignored JSON mode and wrapped the object in prose or a code fence
+            embedded = extract_json_object(content)
+            if embedded is None:
+                raise
+            return embedded
+    
+    def _mark_success(self, url: str, analysis_data: Dict[str, Any], extracted_content: str) -> Dict[str, Any]:
+        """Add bookkeeping fields to a successful analysis and cache it"""
+        analysis_data.update({
+            'url': url,
+            'status': 'success',
+            'content_length': len(extracted_content),
+            'extraction_method': 'tavily'
+        })
+        logger.info("✅ Successfully analyzed clean content from %s", url)
+        self._cache_analysis(url, analysis_data)
+        return analysis_data
+    
+    async def _aanalyze_content(self, url: str, extracted_title: str, extracted_content: str) -> Dict[str, Any]:
+        """Analyze one URL's extracted content with the AI agent"""
+        try:
+            extracted_content = self._truncate_content(extracted_content, self.MAX_CONTENT_TOKENS)
             
             # Now analyze the clean extracted content with the AI agent
-            analysis_prompt = f"""I have extracted clean, structured content from the URL: {url}
+            analysis_prompt = f"""{_ANALYSIS_INSTRUCTIONS}
 
-Title: {extracted_title}
-Content: {extracted_content}
-
-Please analyze this content and provide a structured JSON response:
+I have extracted clean, structured content from the URL: {url}
 
-{{
-    "title": "Page title or main heading",
-    "main_theme": "Primary topic or theme", 
-    "key_points": ["Key point 1", "Key point 2", "Key point 3"],
-    "relevant_quotes": ["Quote 1", "Quote 2"],
-    "supporting_data": ["Data point 1", "Data point 2"],
-    "linkedin_relevance": "How this could be used in LinkedIn posts",
-    "summary": "2-3 sentence summary"
-}}
-
-Focus on extracting the most valuable information for LinkedIn content creation."""
+Title: {extracted_title}
+Content: {extracted_content}"""
             
-            response = self.agent(analysis_prompt)
+            # Each URL gets its own conversation so concurrent analyses don't share history
+            response = await self._create_agent(self._get_pooled_model()).invoke_async(analysis_prompt)
             
             # Check if we got a response
             if not response:
-                print(f"⚠️ Failed to analyze extracted content from {url}")
+                logger.warning("⚠️ Failed to analyze extracted content from %s", url)
                 return self._create_fallback_analysis(url, "No analysis response")
             
-            # Extract content from response
-            if hasattr(response, 'content'):
-                content = response.content
-            else:
-                content = str(response)
-            
-            # Look for JSON in the response
+            # The model is constrained to JSON output (response_format), so parse the response directly
+            content = self._response_text(response)
             try:
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                if json_match:
-                    analysis_data = json.loads(json_match.group())
-                    analysis_data.update({
-                        'url': url,
-                        'status': 'success',
-                        'content_length': len(extracted_content),
-                        'extraction_method': 'tavily'
-                    })
-                    print(f"✅ Successfully analyzed clean content from {url}")
-                    return analysis_data
-                else:
-                    # No JSON found, but we got content - create structured response
-                    print(f"⚠️ Partial analysis completed for {url}")
-                    return self._extract_analysis_from_text(content, url, extracted_content)
+                analysis_data = self._parse_json(content)
+                return self._mark_success(url, analysis_data, extracted_content)
                     
             except json.JSONDecodeError:
-                # JSON parsing failed, extract what we can
-                print(f"⚠️ Partial analysis completed for {url}")
+                # JSON parsing failed (e.g. response cut off at max_tokens), extract what we can
+                logger.warning("⚠️ Partial analysis completed for %s", url)
                 return self._extract_analysis_from_text(content, url, extracted_content)
             
-            
         except Exception as e:
-            print(f"❌ Error analyzing content from {url}: {e}")
+            logger.error("❌ Error analyzing content from %s: %s", url, e)
             return self._create_fallback_analysis(url, str(e))
     
+    async def _aanalyze_batch(self, documents: List[Tuple[str, str, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze several URLs' extracted content with a single LLM call
+        
+        Args:
+            documents: (url, title, extracted content) for each URL
+            
+        Returns:
+            Mapping of each URL to its analysis
+        """
+        if len(documents) == 1:
+            url, title, content = documents[0]
+            return {url: await self._aanalyze_content(url, title, content)}
+        
+        truncated = {url: self._truncate_content(content, self.BATCH_CONTENT_TOKENS) for url, _, content in documents}
+        payload = [{"url": url, "title": title, "content": truncated[url]} for url, title, _ in documents]
+        
+        analysis_prompt = f"""{_BATCH_ANALYSIS_INSTRUCTIONS}
+
+I have extracted clean, structured content from {len(documents)} URLs:
+
+{json.dumps(payload, indent=2, ensure_ascii=False)}"""
+        
+        analyses = {}
+        try:
+            # Same connection pool, but an output budget for several documents
+            response = await self._create_agent(self._get_pooled_batch_model()).invoke_async(analysis_prompt)
+            batch_data = self._parse_json(self._response_text(response))
+            
+            for analysis_data in batch_data.get('analyses') or []:
+                url = analysis_data.get('url') if isinstance(analysis_data, dict) else None
+                if url in truncated and url not in analyses:
+                    analyses[url] = self._mark_success(url, analysis_data, truncated[url])
+                    
+        except Exception as e:
+            logger.warning("⚠️ Batch analysis failed, analyzing URLs individually: %s", e)
+        
+        # Anything the batch didn't cover is analyzed on its own
+        missing = [document for document in documents if document[0] not in analyses]
+        results = await asyncio.gather(*(self._aanalyze_content(*document) for document in missing))
+        analyses.update({document[0]: result for document, result in zip(missing, results)})
+        return analyses
+    
     def _extract_analysis_from_text(self, content: str, url: str, extracted_content: str = None) -> Dict[str, Any]:
         """Extract analysis from unstructured text response"""
         
-        # Look for common patterns in the response
-        lines = content.split('\n')
-        key_points = []
-        quotes = []
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('-') or line.startswith('•') or line.startswith('*'):
-                key_points.append(line[1:].strip())
-            elif '"' in line and len(line) > 20:
-                quotes.append(line.strip('"'))
+        # Look for common patterns in the response, scanning only as far as needed
+        key_points = [match.group(1) for match in islice(_BULLET_RE.finditer(content), 5)]
+        quotes = [match.group(1) for match in islice(_QUOTE_RE.finditer(content), 3)]
         
         # If we got substantial content, mark as partial success
         status = 'partial_success' if len(content) > 200 else 'failed'
@@ -277,8 +635,8 @@ Focus on extracting the most valuable information for LinkedIn content creation.
             'status': status,
             'title': self._extract_title_from_url(url),
             'main_theme': self._infer_theme_from_url(url),
-            'key_points': key_points[:5] if key_points else [content[:200] + "..."],
-            'relevant_quotes': quotes[:3],
+            'key_points': key_points or [content[:200] + "..."],
+            'relevant_quotes': quotes,
             'supporting_data': [],
             'linkedin_relevance': 'Supporting content for LinkedIn post',
             'summary': content[:300] + "..." if len(content) > 300 else content,
@@ -294,27 +652,7 @@ Focus on extracting the most valuable information for LinkedIn content creation.
         theme = self._infer_theme_from_url(url)
         
         # Create analysis based on URL alone
-        key_points = []
-        if 'twitter.com' in url or 'x.com' in url:
-            key_points = [
-                "Social media post from Twitter/X platform",
-                "May contain opinions or breaking news",
-                "Could include viral content or trending topics"
-            ]
-        elif 'nytimes.com' in url:
-            key_points = [
-                "News article from The New York Times",
-                "Professional journalism and reporting", 
-                "Likely contains in-depth analysis of current events"
-            ]
-        elif 'linkedin.com' in url:
-            key_points = [
-                "Professional social media content",
-                "Business or career-related information",
-                "Professional networking context"
-            ]
-        else:
-            key_points = [f"Web content from {url}"]
+        key_points = list(_FALLBACK_BY_DOMAIN.get(_registered_domain(url), (f"Web content from {url}",)))
         
         return {
             'url': url,
@@ -329,60 +667,63 @@ Focus on extracting the most valuable information for LinkedIn content creation.
             'summary': f'Content from {title}. Based on URL structure, this appears to be {theme.lower()} content. The specific details could not be retrieved due to access restrictions.'
         }
     
-    def _extract_title_from_url(self, url: str) -> str:
+    @staticmethod
+    def _canonical_url(url: str) -> str:
+        """Normalize scheme, host case, www prefix, default port, trailing slash, query order and fragment, so equivalent URLs compare equal"""
+        try:
+            parsed = urllib.parse.urlsplit(url)
+            host = (parsed.hostname or '').removeprefix('www.')
+            if parsed.port not in (None, 80, 443):
+                host = f"{host}:{parsed.port}"
+        except ValueError:
+            # Malformed port or host, so compare the URL as written
+            return url
+        query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)))
+        return urllib.parse.urlunsplit(('https', host, parsed.path.rstrip('/'), query, ''))
+    
+    # Pure functions of the URL, called from several paths per URL, so results are memoized
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_title_from_url(url: str) -> str:
         """Extract a meaningful title from URL"""
-        if 'twitter.com' in url or 'x.com' in url:
-            return "Twitter/X Post"
-        elif 'nytimes.com' in url:
-            return "New York Times Article"
-        elif 'linkedin.com' in url:
-            return "LinkedIn Content"
-        else:
-            # Extract domain name
-            try:
-                import urllib.parse
-                parsed = urllib.parse.urlparse(url)
-                domain = parsed.netloc.replace('www.', '')
-                return f"Content from {domain}"
-            except:
-                return "Web Content"
-    
-    def _infer_theme_from_url(self, url: str) -> str:
+        title = _DOMAIN_TITLES.get(_registered_domain(url))
+        if title:
+            return title
+        host = _url_host(url)
+        return f"Content from {host}" if host else "Web Content"
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _infer_theme_from_url(url: str) -> str:
         """Infer content theme from URL"""
-        url_lower = url.lower()
-        
-        if any(keyword in url_lower for keyword in ['ai', 'artificial-intelligence', 'machine-learning', 'chatbot']):
-            return "Artificial Intelligence"
-        elif any(keyword in url_lower for keyword in ['tech', 'technology', 'innovation']):
-            return "Technology"
-        elif any(keyword in url_lower for keyword in ['business', 'finance', 'economy']):
-            return "Business"
-        elif any(keyword in url_lower for keyword in ['health', 'mental-health', 'psychology']):
-            return "Health & Wellness"
-        elif 'twitter.com' in url_lower or 'x.com' in url_lower:
-            return "Social Media Discussion"
-        elif 'news' in url_lower:
-            return "News & Current Events"
-        else:
+        # Each match reports its theme's group; the highest-priority theme wins wherever it appears
+        theme_index = min((match.lastindex for match in _URL_THEME_RE.finditer(url)), default=None)
+        if theme_index is None:
             return "Web Content"
+        return _URL_THEME_KEYWORDS[theme_index - 1][0]
     
-    def analyze_all_links(self, instructions: str) -> Dict[str, Any]:
+    def analyze_all_links(self, instructions: str, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         Complete link analysis workflow: detect links and analyze all content
         
         Args:
             instructions: The instruction text containing potential URLs
+            bypass_cache: Re-fetch and re-analyze every URL even if cached analyses exist
             
         Returns:
             Comprehensive analysis of all links found
         """
-        print("🔗 Starting link analysis...")
+        return self._run_async(self.aanalyze_all_links(instructions, bypass_cache))
+    
+    async def aanalyze_all_links(self, instructions: str, bypass_cache: bool = False) -> Dict[str, Any]:
+        """Async version of analyze_all_links, extracting and analyzing URLs in concurrent batches"""
+        logger.info("🔗 Starting link analysis...")
         
         # Step 1: Detect all URLs
         urls = self.detect_links(instructions)
         
         if not urls:
-            print("ℹ️ No URLs found in instructions")
+            logger.info("ℹ️ No URLs found in instructions")
             return {
                 'urls_found': [],
                 'total_urls': 0,
@@ -395,40 +736,56 @@ Focus on extracting the most valuable information for LinkedIn content creation.
                 'summary': 'No links found in instructions to analyze.'
             }
         
-        # Step 2: Analyze each URL
-        content_summaries = []
-        successful_analyses = 0
-        partial_analyses = 0
-        failed_analyses = 0
-        
-        for url in urls:
-            analysis = self.fetch_and_analyze_content(url)
-            content_summaries.append(analysis)
+        # Step 2: Analyze the URLs, reusing cached analyses where possible
+        analyses = {}
+        if not bypass_cache:
+            for url in urls:
+                cached = self._get_cached_analysis(url)
+                if cached:
+                    logger.debug("♻️ Using cached analysis for %s", url)
+                    analyses[url] = cached
+        
+        pending = [url for url in urls if url not in analyses]
+        if pending:
+            extracted = await self._aextract_contents(pending)
             
-            if analysis['status'] == 'success':
-                successful_analyses += 1
-            elif analysis['status'] in ['partial_success', 'fallback']:
-                partial_analyses += 1
-            else:
-                failed_analyses += 1
-        
-        # Step 3: Aggregate insights (include partial and fallback analyses)
-        all_themes = []
-        all_key_points = []
-        all_quotes = []
-        
-        for summary in content_summaries:
-            # Include all analyses that have useful information
-            if summary['status'] in ['success', 'partial_success', 'fallback']:
-                if 'main_theme' in summary and summary['main_theme']:
-                    all_themes.append(summary['main_theme'])
-                if 'key_points' in summary and summary['key_points']:
-                    all_key_points.extend(summary['key_points'])
-                if 'relevant_quotes' in summary and summary['relevant_quotes']:
-                    all_quotes.extend(summary['relevant_quotes'])
+            documents = []
+            for url in pending:
+                if 'error' in extracted[url]:
+                    analyses[url] = self._create_fallback_analysis(url, extracted[url]['error'])
+                else:
+                    documents.append((url, extracted[url]['title'], extracted[url]['content']))
+            
+            # Several documents share each LLM call, and the calls run concurrently
+            batches = [documents[i:i + self.MAX_URLS_PER_BATCH] for i in range(0, len(documents), self.MAX_URLS_PER_BATCH)]
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ANALYSES)
+            
+            async def bounded(batch: List[Tuple[str, str, str]]) -> Dict[str, Dict[str, Any]]:
+                async with semaphore:
+                    return await self._aanalyze_batch(batch)
+            
+            results = await asyncio.gather(*(bounded(batch) for batch in batches), return_exceptions=True)
+            for batch, result in zip(batches, results):
+                if isinstance(result, BaseException):
+                    analyses.update({url: self._create_fallback_analysis(url, str(result)) for url, _, _ in batch})
+                else:
+                    analyses.update(result)
+        
+        content_summaries = [analyses[url] for url in urls]
+        
+        status_counts = Counter(summary['status'] for summary in content_summaries)
+        successful_analyses = status_counts['success']
+        partial_analyses = status_counts['partial_success'] + status_counts['fallback']
+        failed_analyses = len(content_summaries) - successful_analyses - partial_analyses
+        
+        # Step 3: Aggregate insights (include partial and fallback analyses, which have useful information)
+        useful_summaries = [summary for summary in content_summaries if summary['status'] in ('success', 'partial_success', 'fallback')]
+        # Order-preserving dedup of themes
+        themes = list(dict.fromkeys(summary['main_theme'] for summary in useful_summaries if summary.get('main_theme')))
+        all_key_points = [point for summary in useful_summaries for point in summary.get('key_points') or ()]
+        all_quotes = [quote for summary in useful_summaries for quote in summary.get('relevant_quotes') or ()]
         
         # Create final analysis
-        total_useful_analyses = successful_analyses + partial_analyses
         final_analysis = {
             'urls_found': urls,
             'total_urls': len(urls),
@@ -436,19 +793,19 @@ Focus on extracting the most valuable information for LinkedIn content creation.
             'partial_analyses': partial_analyses,
             'failed_analyses': failed_analyses,
             'content_summaries': content_summaries,
-            'aggregated_themes': list(set(all_themes)),  # Remove duplicates
+            'aggregated_themes': themes,
             'all_key_points': all_key_points,
             'all_quotes': all_quotes,
-            'summary': f'Analyzed {len(urls)} URLs with {successful_analyses} successful and {partial_analyses} partial analyses. Found {len(set(all_themes))} unique themes and {len(all_key_points)} key points.'
+            'summary': f'Analyzed {len(urls)} URLs with {successful_analyses} successful and {partial_analyses} partial analyses. Found {len(themes)} unique themes and {len(all_key_points)} key points.'
         }
         
-        print(f"🔗 Link analysis complete:")
-        print(f"   - URLs found: {len(urls)}")
-        print(f"   - Successful analyses: {successful_analyses}")
-        print(f"   - Partial analyses: {partial_analyses}")
-        print(f"   - Failed analyses: {failed_analyses}")
-        print(f"   - Themes identified: {len(set(all_themes))}")
-        print(f"   - Key points extracted: {len(all_key_points)}")
+        logger.info("🔗 Link analysis complete:")
+        logger.info("   - URLs found: %d", len(urls))
+        logger.info("   - Successful analyses: %d", successful_analyses)
+        logger.info("   - Partial analyses: %d", partial_analyses)
+        logger.info("   - Failed analyses: %d", failed_analyses)
+        logger.info("   - Themes identified: %d", len(themes))
+        logger.info("   - Key points extracted: %d", len(all_key_points))
         
         return final_analysis
 
@@ -471,7 +828,10 @@ def main():
         print("\n" + "="*60)
         print("LINK ANALYSIS RESULTS")
         print("="*60)
-        print(json.dumps(analysis, indent=2))
+        if orjson:
+            print(orjson.dumps(analysis, option=orjson.OPT_INDENT_2).decode('utf-8'))
+        else:
+            print(json.dumps(analysis, indent=2))
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Logging Configuration
+
+Non-blocking logging for the agents package. Log records are put on a queue
+and written to stdout by a background listener thread, so agent hot paths
+(including concurrent analyses) never block on terminal I/O.
+
+Set LOG_LEVEL (default INFO) to control verbosity; DEBUG=true enables
+debug-level output.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from dotenv import load_dotenv
+
+_listener = None
+
+
+def _configure_logging():
+    """Attach the queue handler to the package logger and start the listener (once)"""
+    global _listener
+    if _listener:
+        return
+
+    load_dotenv()
+    if os.getenv("DEBUG", "false").lower() in ("true", "1", "yes", "on"):
+        level = logging.DEBUG
+    else:
+        level = os.getenv("LOG_LEVEL", "INFO").upper()
+
+    # Plain messages on stdout, matching the rest of the CLI output
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler)
+
+    package_logger = logging.getLogger("agents")
+    package_logger.addHandler(QueueHandler(log_queue))
+    package_logger.setLevel(level)
+    package_logger.propagate = False
+
+    _listener.start()
+    # Flush anything still queued before the interpreter exits
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a logger whose output goes through the shared non-blocking handler"""
+    _configure_logging()
+    # Modules run as scripts (python -m agents.x) are named __main__, outside the package logger
+    if name != "agents" and not name.startswith("agents."):
+        name = f"agents.{name}"
+    return logging.getLogger(name)
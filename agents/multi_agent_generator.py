@@ -2,76 +2,145 @@
 """
 Multi-Agent LinkedIn Post Generator
 
-Main orchestrator that coordinates specialized agents using Strands native workflow system:
+Main orchestrator that coordinates specialized agents:
 1. LinkAnalysisAgent - Analyzes web links in instructions
 2. ResearchAgent - Conducts topic research
 3. PostCompositionAgent - Generates final LinkedIn post
 
-Uses Strands workflow tool for native dependency management and task orchestration.
+Phases run in dependency order on a single event loop, with link analysis and
+research fanning out concurrently within each phase.
 """
 
 import os
+import sys
 import json
 import uuid
-from typing import Dict, Any
+import asyncio
+import warnings
+import httpx
+from functools import cached_property
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple, Iterator
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 
-from strands import Agent
-from strands_tools import workflow
-from strands.models.openai import OpenAIModel
+try:
+    import orjson  # Optional speedup (uv sync --extra speedups)
+except ImportError:
+    orjson = None
 
 from .link_analysis_agent import LinkAnalysisAgent
 from .research_agent import ResearchAgent
 from .post_composition_agent import PostCompositionAgent
+from .file_cache import read_text_cached
+from .logging_config import get_logger
+from .response_cache import ResponseCache
 
 # Load environment variables
 load_dotenv()
 
+logger = get_logger(__name__)
+
+# One JSON record per line, so saving a run appends to the file instead of rewriting it
+WORKFLOW_HISTORY_FILE = Path("workflow_history.jsonl")
+
+
+def load_workflow_history(path: Path = WORKFLOW_HISTORY_FILE) -> Iterator[Dict[str, Any]]:
+    """Yield the saved workflow metadata records, oldest first"""
+    if not path.exists():
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _preview(obj: Any, limit: int = 500) -> str:
+    """The start of obj as indented JSON, for debug output"""
+    # The pure-Python encoder yields the JSON piece by piece, so only what is shown gets encoded
+    parts, length = [], 0
+    for part in json.JSONEncoder(indent=2, ensure_ascii=False, default=str).iterencode(obj):
+        parts.append(part)
+        length += len(part)
+        if length > limit:
+            return "".join(parts)[:limit] + "..."
+    return "".join(parts)
+
 
 class LinkedInMultiAgentGenerator:
-    def __init__(self):
-        """Initialize the Multi-Agent Generator with workflow orchestration"""
+    # Seconds a cached link analysis + research plan stays valid, matching the agents' own caches
+    PLAN_CACHE_TTL = 24 * 60 * 60
+    # Bump when the shape of the link analysis or research results changes
+    PLAN_CACHE_VERSION = "1"
+    
+    def __init__(self, use_cache: Optional[bool] = None):
+        """Initialize the Multi-Agent Generator
+        
+        Args:
+            use_cache: Reuse link analyses, research, whole plans and composed posts from previous runs
+                (defaults to USE_CACHE, which is on unless set to false)
+        """
         self.input_dir = Path("input")
         
-        # OpenAI configuration for workflow orchestrator
+        # OpenAI configuration shared by the specialized agents
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.default_model = os.getenv("DEFAULT_MODEL", "gpt-4o")
         self.debug = os.getenv("DEBUG", "false").lower() in ("true", "1", "yes", "on")
+        if use_cache is None:
+            use_cache = os.getenv("USE_CACHE", "true").lower() in ("true", "1", "yes", "on")
         
         if not self.openai_api_key:
             raise Exception("OPENAI_API_KEY not found in .env file")
         
-        # Initialize workflow orchestrator
-        try:
-            model = OpenAIModel(
-                client_args={"api_key": self.openai_api_key},
-                model_id=self.default_model,
-                params={"temperature": 0.7, "max_tokens": 2000}
-            )
-            
-            self.orchestrator = Agent(
-                system_prompt="You are a workflow orchestrator for LinkedIn post generation. Coordinate multiple specialized agents to create comprehensive, well-researched LinkedIn posts.",
-                model=model,
-                tools=[workflow]
-            )
-            
-            print("✅ Multi-Agent Generator initialized with Strands workflow orchestration")
-            if self.debug:
-                print("🐛 Debug mode enabled")
-                
-        except Exception as e:
-            raise Exception(f"Failed to initialize Multi-Agent Generator: {e}")
+        logger.info("✅ Multi-Agent Generator initialized")
+        logger.debug("🐛 Debug mode enabled")
         
-        # Initialize specialized agents with API key
-        self.link_agent = LinkAnalysisAgent(openai_api_key=self.openai_api_key)
-        self.research_agent = ResearchAgent(openai_api_key=self.openai_api_key) 
-        self.composition_agent = PostCompositionAgent(openai_api_key=self.openai_api_key)
+        # Specialized agents are built on first use (see the properties below), so a run that
+        # hits the plan cache never sets up link analysis or research
+        self.use_cache = use_cache
+        self.link_analysis_model = os.getenv("LINK_ANALYSIS_MODEL", "gpt-4o-mini")
+        self.research_model = os.getenv("RESEARCH_MODEL", "gpt-4o-mini")
         
-        # Workflow state
-        self.current_workflow_id = None
-        self.workflow_results = {}
+        # Link analysis and research depend only on the instructions, so re-runs with the same
+        # instructions (e.g. while iterating on style) can go straight to composition
+        self.plan_cache = ResponseCache() if use_cache else None
+    
+    @cached_property
+    def http_client(self) -> httpx.AsyncClient:
+        """Connection pool shared by link analysis and research for one event loop run"""
+        return httpx.AsyncClient(limits=httpx.Limits(max_connections=32, max_keepalive_connections=16))
+    
+    @cached_property
+    def link_agent(self) -> LinkAnalysisAgent:
+        return LinkAnalysisAgent(
+            openai_api_key=self.openai_api_key, model=self.link_analysis_model, use_cache=self.use_cache,
+            http_client=self.http_client
+        )
+    
+    @cached_property
+    def research_agent(self) -> ResearchAgent:
+        return ResearchAgent(
+            openai_api_key=self.openai_api_key, model=self.research_model, use_cache=self.use_cache,
+            http_client=self.http_client
+        )
+    
+    @cached_property
+    def composition_agent(self) -> PostCompositionAgent:
+        return PostCompositionAgent(openai_api_key=self.openai_api_key, use_cache=self.use_cache)
+    
+    async def aclose(self):
+        """Close the async agents and the connection pool they share"""
+        for name in ("link_agent", "research_agent"):
+            agent = self.__dict__.get(name)
+            if agent:
+                await agent.aclose()
+        
+        http_client = self.__dict__.pop("http_client", None)
+        if http_client:
+            await http_client.aclose()
+            # The pool is bound to the event loop that is ending, so the next run builds
+            # fresh agents around a new one
+            self.__dict__.pop("link_agent", None)
+            self.__dict__.pop("research_agent", None)
     
     def read_instructions(self) -> str:
         """Read instructions from input/instructions.txt"""
@@ -81,260 +150,160 @@ class LinkedInMultiAgentGenerator:
             raise Exception(f"Instructions file not found: {instructions_file}")
         
         try:
-            with open(instructions_file, 'r', encoding='utf-8') as f:
-                instructions = f.read().strip()
+            instructions = read_text_cached(instructions_file)
                 
             if not instructions:
                 raise Exception("Instructions file is empty")
                 
-            print(f"✅ Read instructions: {len(instructions)} characters")
+            logger.info("✅ Read instructions: %d characters", len(instructions))
             return instructions
             
         except Exception as e:
             raise Exception(f"Error reading instructions: {e}")
     
-    def create_workflow_definition(self, instructions: str) -> Dict[str, Any]:
+    def execute_sequential_workflow(self, instructions: str) -> str:
         """
-        Create Strands workflow definition for LinkedIn post generation
+        Execute the workflow sequentially using specialized agents
         
         Args:
             instructions: User instructions for the post
             
         Returns:
-            Workflow definition dictionary
+            Generated LinkedIn post
         """
-        # Generate unique workflow ID
-        workflow_id = f"linkedin_post_{uuid.uuid4().hex[:8]}"
-        
-        workflow_definition = {
-            "workflow_id": workflow_id,
-            "tasks": [
-                {
-                    "task_id": "link_analysis",
-                    "description": f"Analyze and summarize web links found in instructions: {instructions[:200]}...",
-                    "system_prompt": """You are a web content analysis specialist. Your job is to:
-1. Detect URLs in the provided instructions
-2. Fetch and analyze web content from those URLs
-3. Extract key themes, important points, and relevant quotes
-4. Structure findings for LinkedIn content creation
-
-Focus on information that would be valuable for professional LinkedIn posts.""",
-                    "priority": 5,  # High priority, runs first
-                    "dependencies": [],
-                    "agent_type": "link_analysis"
-                },
-                {
-                    "task_id": "topic_research",
-                    "description": f"Conduct comprehensive research on key topics from instructions and link analysis for LinkedIn content creation",
-                    "system_prompt": """You are a research specialist for LinkedIn content creation. Your job is to:
-1. Extract key topics from instructions and link analysis
-2. Research current trends and industry implications
-3. Gather supporting statistics and expert perspectives  
-4. Identify LinkedIn-specific angles and professional insights
-5. Generate actionable insights for the target audience
-
-Focus on professional, business-relevant information that adds value to LinkedIn posts.""",
-                    "priority": 3,  # Medium priority, runs after link analysis
-                    "dependencies": ["link_analysis"],
-                    "agent_type": "research"
-                },
-                {
-                    "task_id": "post_composition",
-                    "description": "Generate final LinkedIn post combining instructions, link analysis, research findings, and user's writing style",
-                    "system_prompt": """You are an expert LinkedIn content creator. Your job is to:
-1. Synthesize information from instructions, link analysis, and research
-2. Apply the user's specific writing style and voice patterns
-3. Create authentic, engaging LinkedIn content that doesn't sound AI-generated
-4. Follow LinkedIn best practices for professional engagement
-5. Integrate all insights naturally and compellingly
-
-Focus on creating content that sparks meaningful professional discussion.""",
-                    "priority": 1,  # Lowest priority, runs last
-                    "dependencies": ["link_analysis", "topic_research"],
-                    "agent_type": "composition"
-                }
-            ]
-        }
-        
-        return workflow_definition
+        return asyncio.run(self.aexecute_sequential_workflow(instructions))
     
-    def execute_task_with_agent(self, task_definition: Dict[str, Any], context_data: Dict[str, Any]) -> Any:
+    async def aexecute_sequential_workflow(self, instructions: str) -> str:
         """
-        Execute a specific task using the appropriate specialized agent
+        Execute the workflow phases on a single event loop
         
-        Args:
-            task_definition: Task configuration from workflow
-            context_data: Data from previous tasks
-            
-        Returns:
-            Task execution results
+        Each phase depends on the previous one, but within a phase the agents fan out
+        concurrently (URLs in link analysis, topics in research) and keep their
+        connection pools for the whole run.
         """
-        task_id = task_definition["task_id"]
-        agent_type = task_definition["agent_type"]
-        
-        print(f"🤖 Executing task: {task_id} (agent: {agent_type})")
-        
         try:
-            if agent_type == "link_analysis":
-                # Execute link analysis
-                instructions = context_data.get("instructions", "")
-                result = self.link_agent.analyze_all_links(instructions)
-                
-            elif agent_type == "research":
-                # Execute research
-                instructions = context_data.get("instructions", "")
-                link_analysis = context_data.get("link_analysis", {})
-                result = self.research_agent.conduct_comprehensive_research(instructions, link_analysis)
-                
-            elif agent_type == "composition":
-                # Execute post composition
-                composition_context = {
-                    "instructions": context_data.get("instructions", ""),
-                    "link_analysis": context_data.get("link_analysis", {}),
-                    "research_findings": context_data.get("topic_research", {})
-                }
-                result = self.composition_agent.compose_linkedin_post(composition_context, debug=self.debug)
-                
-            else:
-                raise Exception(f"Unknown agent type: {agent_type}")
-            
-            print(f"✅ Task {task_id} completed successfully")
-            return result
-            
-        except Exception as e:
-            print(f"❌ Task {task_id} failed: {e}")
-            raise e
+            return await self._aexecute_phases(instructions)
+        finally:
+            # Pooled clients are bound to this event loop, so close them before it goes away
+            await self.aclose()
     
-    def execute_sequential_workflow(self, instructions: str) -> str:
-        """
-        Execute the workflow sequentially using specialized agents
-        (Alternative to Strands workflow tool for more direct control)
-        
-        Args:
-            instructions: User instructions for the post
-            
-        Returns:
-            Generated LinkedIn post
-        """
-        print("🚀 Starting sequential multi-agent workflow...")
-        
-        # Initialize context
-        workflow_context = {
-            "instructions": instructions,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        # Step 1: Link Analysis
-        print("\n" + "="*50)
-        print("🔗 PHASE 1: LINK ANALYSIS")  
-        print("="*50)
-        
-        link_analysis = self.link_agent.analyze_all_links(instructions)
-        workflow_context["link_analysis"] = link_analysis
-        
-        if self.debug:
-            print(f"🐛 Link analysis results: {json.dumps(link_analysis, indent=2)[:500]}...")
-        
-        # Step 2: Topic Research
-        print("\n" + "="*50)
-        print("🔍 PHASE 2: TOPIC RESEARCH")
-        print("="*50)
+    async def _aexecute_phases(self, instructions: str) -> str:
+        """Run link analysis, research and composition in dependency order"""
+        composition_context, materials = await self._aprepare_composition(instructions)
         
-        research_findings = self.research_agent.conduct_comprehensive_research(
-            instructions, link_analysis
+        # Composition is synchronous, so it runs in a worker thread rather than blocking the event loop
+        final_post = await asyncio.to_thread(
+            self.composition_agent.compose_linkedin_post, composition_context, debug=self.debug, materials=materials
         )
-        workflow_context["research_findings"] = research_findings
         
-        if self.debug:
-            print(f"🐛 Research findings: {json.dumps(research_findings, indent=2)[:500]}...")
+        self._finish_workflow(composition_context, final_post)
+        return final_post
+    
+    async def _aprepare_composition(self, instructions: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run link analysis and research, returning the composition context and prompt materials"""
+        logger.info("🚀 Starting sequential multi-agent workflow...")
+        
+        # The style guide, base prompt and example posts don't depend on the plan, so they are
+        # loaded in a worker thread while link analysis and research are in flight
+        materials_task = asyncio.create_task(asyncio.to_thread(self.composition_agent.load_prompt_materials))
+        try:
+            link_analysis, research_findings = await self._aplan(instructions)
+        except BaseException:
+            materials_task.cancel()
+            raise
         
         # Step 3: Post Composition
-        print("\n" + "="*50)
-        print("✍️ PHASE 3: POST COMPOSITION")
-        print("="*50)
+        logger.info("\n" + "="*50)
+        logger.info("✍️ PHASE 3: POST COMPOSITION")
+        logger.info("="*50)
         
         composition_context = {
             "instructions": instructions,
             "link_analysis": link_analysis, 
             "research_findings": research_findings
         }
-        
-        final_post = self.composition_agent.compose_linkedin_post(composition_context, debug=self.debug)
-        
-        if self.debug:
-            print(f"🐛 Final post length: {len(final_post)} characters")
+        return composition_context, await materials_task
+    
+    def _finish_workflow(self, composition_context: Dict[str, Any], final_post: str):
+        """Record a completed run"""
+        logger.debug("🐛 Final post length: %d characters", len(final_post))
         
         # Save workflow metadata
+        workflow_context = dict(composition_context, timestamp=datetime.now().isoformat())
         self.save_workflow_metadata(workflow_context, final_post)
         
-        print("\n" + "🎉 Multi-agent workflow completed successfully!")
-        return final_post
+        logger.info("\n" + "🎉 Multi-agent workflow completed successfully!")
     
-    def execute_strands_workflow(self, instructions: str) -> str:
-        """
-        Execute the workflow using Strands native workflow tool
-        (Primary method using Strands orchestration)
+    async def _aplan(self, instructions: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run link analysis and research for the instructions, or reuse a cached plan for them"""
+        plan = self._get_cached_plan(instructions)
+        if plan:
+            logger.info("♻️ Reusing link analysis and research from a previous run with the same instructions")
+            return plan["link_analysis"], plan["research_findings"]
         
-        Args:
-            instructions: User instructions for the post
-            
-        Returns:
-            Generated LinkedIn post
-        """
-        print("🚀 Starting Strands native workflow...")
+        # Step 1: Link Analysis
+        logger.info("\n" + "="*50)
+        logger.info("🔗 PHASE 1: LINK ANALYSIS")
+        logger.info("="*50)
         
-        try:
-            # Create workflow definition
-            workflow_def = self.create_workflow_definition(instructions)
-            self.current_workflow_id = workflow_def["workflow_id"]
-            
-            print(f"📋 Created workflow: {self.current_workflow_id}")
-            
-            # Create workflow using Strands workflow tool
-            create_response = self.orchestrator.tool.workflow(
-                action="create",
-                workflow_id=self.current_workflow_id,
-                tasks=workflow_def["tasks"]
-            )
-            
-            if self.debug:
-                print(f"🐛 Workflow creation response: {create_response}")
-            
-            # Execute workflow  
-            print("🎬 Starting workflow execution...")
-            start_response = self.orchestrator.tool.workflow(
-                action="start", 
-                workflow_id=self.current_workflow_id
-            )
-            
-            if self.debug:
-                print(f"🐛 Workflow start response: {start_response}")
-            
-            # Monitor workflow progress
-            print("📊 Monitoring workflow progress...")
-            status_response = self.orchestrator.tool.workflow(
-                action="status",
-                workflow_id=self.current_workflow_id
-            )
-            
-            if self.debug:
-                print(f"🐛 Workflow status: {status_response}")
-            
-            # For now, fall back to sequential execution since we need to integrate our agents
-            print("🔄 Executing tasks with specialized agents...")
-            return self.execute_sequential_workflow(instructions)
-            
-        except Exception as e:
-            print(f"❌ Strands workflow execution failed: {e}")
-            print("🔄 Falling back to sequential execution...")
-            return self.execute_sequential_workflow(instructions)
+        link_analysis = await self.link_agent.aanalyze_all_links(instructions)
+        
+        logger.debug("🐛 Link analysis results: %s", _preview(link_analysis))
+        
+        # Step 2: Topic Research
+        logger.info("\n" + "="*50)
+        logger.info("🔍 PHASE 2: TOPIC RESEARCH")
+        logger.info("="*50)
+        
+        research_findings = await self.research_agent.aconduct_comprehensive_research(
+            instructions, link_analysis
+        )
+        
+        logger.debug("🐛 Research findings: %s", _preview(research_findings))
+        
+        self._cache_plan(instructions, link_analysis, research_findings)
+        return link_analysis, research_findings
+    
+    def _plan_cache_key(self, instructions: str) -> str:
+        """Cache key for the link analysis and research of these instructions"""
+        # Whitespace-only edits to the instructions don't change the plan
+        normalized = " ".join(instructions.split())
+        return ResponseCache.make_key(
+            "plan", self.PLAN_CACHE_VERSION, self.link_analysis_model, self.research_model, normalized
+        )
+    
+    def _get_cached_plan(self, instructions: str) -> Optional[Dict[str, Any]]:
+        """Return a still-fresh link analysis and research plan for these instructions, if there is one"""
+        if not self.plan_cache:
+            return None
+        cached = self.plan_cache.get(self._plan_cache_key(instructions), max_age=self.PLAN_CACHE_TTL)
+        return json.loads(cached) if cached is not None else None
+    
+    @staticmethod
+    def _plan_succeeded(link_analysis: Dict[str, Any], research_findings: Dict[str, Any]) -> bool:
+        """Whether every link analysis and topic research in the plan succeeded"""
+        if link_analysis.get('failed_analyses', 0):
+            return False
+        if any(summary.get('status') == 'fallback' for summary in link_analysis.get('content_summaries', [])):
+            return False
+        return not any('error' in research for research in research_findings.get('research_results', {}).values())
+    
+    def _cache_plan(self, instructions: str, link_analysis: Dict[str, Any], research_findings: Dict[str, Any]):
+        """Store the link analysis and research for reuse by later runs"""
+        # A plan degraded by a transient outage would otherwise be replayed for a whole day
+        if not self._plan_succeeded(link_analysis, research_findings):
+            logger.debug("🐛 Not caching the plan, as some link analyses or research failed")
+            return
+        if self.plan_cache:
+            plan = {"link_analysis": link_analysis, "research_findings": research_findings}
+            self.plan_cache.set(self._plan_cache_key(instructions), json.dumps(plan, ensure_ascii=False))
     
     def save_workflow_metadata(self, workflow_context: Dict[str, Any], final_post: str):
         """Save workflow execution metadata for debugging and analysis"""
         try:
             metadata = {
                 "timestamp": datetime.now().isoformat(),
-                "workflow_id": self.current_workflow_id,
+                "workflow_id": f"linkedin_post_{uuid.uuid4().hex[:8]}",
                 "instructions": workflow_context["instructions"],
                 "final_post": final_post,
                 "link_analysis_summary": workflow_context.get("link_analysis", {}).get("summary", ""),
@@ -344,55 +313,120 @@ Focus on creating content that sparks meaningful professional discussion.""",
                 "topics_researched": len(workflow_context.get("research_findings", {}).get("topics_researched", []))
             }
             
-            # Save to workflow history
-            workflow_history_file = Path("workflow_history.json")
-            history = []
-            
-            if workflow_history_file.exists():
-                with open(workflow_history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-            
-            history.append(metadata)
-            
-            with open(workflow_history_file, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, ensure_ascii=False)
+            # Append to workflow history
+            if orjson:
+                record = orjson.dumps(metadata).decode('utf-8')
+            else:
+                record = json.dumps(metadata, ensure_ascii=False)
+            with open(WORKFLOW_HISTORY_FILE, 'a', encoding='utf-8') as f:
+                f.write(record + "\n")
                 
-            print(f"💾 Workflow metadata saved to {workflow_history_file}")
+            logger.info("💾 Workflow metadata saved to %s", WORKFLOW_HISTORY_FILE)
             
         except Exception as e:
-            print(f"⚠️ Could not save workflow metadata: {e}")
+            logger.warning("⚠️ Could not save workflow metadata: %s", e)
     
-    def generate_post(self, use_strands_workflow: bool = False) -> str:
+    def generate_post(self, use_strands_workflow: Optional[bool] = None, *,
+                      on_chunk: Optional[Callable[[str], None]] = None) -> str:
         """
         Main entry point for generating LinkedIn posts
         
         Args:
-            use_strands_workflow: Whether to use Strands native workflow (True) or sequential (False)
+            use_strands_workflow: Deprecated and ignored; the agents always run in dependency order
+            on_chunk: If given, composition is streamed and this is called with each chunk
+                of the post as soon as the model produces it
             
         Returns:
             Generated LinkedIn post
         """
+        if use_strands_workflow is not None:
+            warnings.warn(
+                "use_strands_workflow is deprecated and ignored; the agents always run in dependency order",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        
         try:
+            if on_chunk:
+                return asyncio.run(self._astream_post(on_chunk))
+            
             # Read instructions
             instructions = self.read_instructions()
             
-            # Execute workflow - use sequential by default for better reliability
-            if use_strands_workflow:
-                print("🔄 Attempting Strands native workflow...")
-                try:
-                    final_post = self.execute_strands_workflow(instructions)
-                except Exception as workflow_error:
-                    print(f"⚠️ Strands workflow failed: {workflow_error}")
-                    print("🔄 Falling back to sequential execution...")
-                    final_post = self.execute_sequential_workflow(instructions)
-            else:
-                final_post = self.execute_sequential_workflow(instructions)
-            
-            return final_post
+            return self.execute_sequential_workflow(instructions)
             
         except Exception as e:
-            print(f"❌ Multi-agent generation failed: {e}")
+            logger.error("❌ Multi-agent generation failed: %s", e)
             raise e
+    
+    async def agenerate_post_stream(self) -> AsyncIterator[str]:
+        """
+        Generate a LinkedIn post, yielding its text as the composition model produces it
+        
+        Link analysis and research run as in generate_post; only composition is streamed,
+        so the post starts appearing as soon as the model starts writing it.
+        
+        Yields:
+            Chunks of the generated post, in order
+        """
+        instructions = self.read_instructions()
+        try:
+            composition_context, materials = await self._aprepare_composition(instructions)
+            
+            chunks = []
+            async for chunk in self.composition_agent.acompose_linkedin_post_stream(
+                composition_context, debug=self.debug, materials=materials
+            ):
+                chunks.append(chunk)
+                yield chunk
+            
+            self._finish_workflow(composition_context, "".join(chunks).strip())
+        finally:
+            await self.aclose()
+    
+    async def _astream_post(self, on_chunk: Callable[[str], None]) -> str:
+        """Stream a post to on_chunk and return its full text"""
+        chunks = []
+        async for chunk in self.agenerate_post_stream():
+            on_chunk(chunk)
+            chunks.append(chunk)
+        return "".join(chunks).strip()
+    
+    def generate_post_batch(self, instruction_list: List[str], use_batch_api: bool = True) -> List[str]:
+        """
+        Generate one LinkedIn post per set of instructions, for offline bulk runs
+        
+        Link analysis and research run as usual; the compositions are then submitted
+        together as a single OpenAI Batch API job, billed at half price but completing
+        within up to 24 hours.
+        
+        Args:
+            instruction_list: Instructions for each post
+            use_batch_api: Compose through the Batch API (True) or with concurrent regular calls (False)
+            
+        Returns:
+            Generated LinkedIn posts in the same order as instruction_list
+        """
+        plans = asyncio.run(self._aplan_all(instruction_list))
+        
+        contexts = [
+            {"instructions": instructions, "link_analysis": link_analysis, "research_findings": research_findings}
+            for instructions, (link_analysis, research_findings) in zip(instruction_list, plans)
+        ]
+        posts = self.composition_agent.compose_batch(contexts, use_batch_api=use_batch_api)
+        
+        for context, post in zip(contexts, posts):
+            workflow_context = dict(context, timestamp=datetime.now().isoformat())
+            self.save_workflow_metadata(workflow_context, post)
+        
+        return posts
+    
+    async def _aplan_all(self, instruction_list: List[str]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Run link analysis and research for each set of instructions on one event loop"""
+        try:
+            return [await self._aplan(instructions) for instructions in instruction_list]
+        finally:
+            await self.aclose()
 
 
 def main():
@@ -400,14 +434,20 @@ def main():
     try:
         generator = LinkedInMultiAgentGenerator()
         
-        # Generate post using Strands workflow orchestration
-        final_post = generator.generate_post(use_strands_workflow=True)
+        # Show the post as it is written, starting with the first chunk
+        streamed = []
+        def show_chunk(chunk: str):
+            if not streamed:
+                print("\n" + "="*80)
+                print("🎯 GENERATED LINKEDIN POST:")
+                print("="*80)
+            streamed.append(chunk)
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        
+        final_post = generator.generate_post(on_chunk=show_chunk)
         
         # Display results
-        print("\n" + "="*80)
-        print("🎯 GENERATED LINKEDIN POST:")
-        print("="*80)
-        print(final_post)
         print("="*80)
         print(f"📊 Character count: {len(final_post)}")
         print("="*80)
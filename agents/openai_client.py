@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+OpenAI Client Settings
+
+Client arguments shared by every OpenAI client the agents create, so retry behaviour is
+configured in one place. Transient failures (rate limits, timeouts, connection errors and
+5xx responses) are retried by the OpenAI client itself, with jittered exponential backoff
+that honours the server's Retry-After header, instead of failing the whole workflow.
+
+Set OPENAI_MAX_RETRIES to change the number of retries (default 5).
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Retries per request on transient errors; the OpenAI client's own default is 2
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+
+
+def openai_client_args(api_key: str, http_client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    """Keyword arguments for an OpenAI client (or a Strands OpenAIModel's client_args)"""
+    client_args = {"api_key": api_key, "max_retries": OPENAI_MAX_RETRIES}
+    if http_client:
+        client_args["http_client"] = http_client
+    return client_args
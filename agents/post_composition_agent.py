@@ -10,53 +10,95 @@ Specialized agent for generating final LinkedIn posts by combining all context:
 - Few-shot examples from existing posts
 """
 
+import asyncio
+import heapq
 import json
+import os
 import random
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import AsyncIterator, Dict, List, Any, Optional
+from dotenv import load_dotenv
 from strands import Agent
 
+from .file_cache import read_text_cached
+from .logging_config import get_logger
+from .openai_client import openai_client_args
+from .response_cache import ResponseCache
+from .token_counting import count_tokens
+
+load_dotenv()
+
+logger = get_logger(__name__)
+
+# Post body in exported post files: the text between the CONTENT: header's dashed underline
+# and the RAW DATA section (or the end of the file)
+_CONTENT_RE = re.compile(r'CONTENT:\s*\n-+\s*\n(.*?)(?:\n\nRAW DATA|$)', re.DOTALL)
+# Runs of blank lines, collapsed to a single blank line
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+# What every composed post must do, placed after the examples in the composition prompt
+_COMPOSITION_INSTRUCTIONS = """Based on the style guide and examples above and the context below, generate a LinkedIn post that:
+1. Addresses the original instructions completely
+2. Incorporates insights from the link analysis naturally
+3. Weaves in research findings and trends seamlessly  
+4. Maintains the exact writing style demonstrated in the examples
+5. Creates engaging, authentic content that doesn't sound AI-generated
+6. Follows LinkedIn best practices for professional engagement"""
+
 
 class PostCompositionAgent:
-    def __init__(self, openai_api_key: str = None, model: str = None):
-        """Initialize the Post Composition Agent"""
+    # Seconds between status checks when waiting on an OpenAI Batch API job
+    BATCH_POLL_INTERVAL = 30
+    # Example posts are drawn from this many most recently modified files, so the files read
+    # per composition stay bounded however large posts/ grows
+    EXAMPLE_POOL_SIZE = 50
+    # Threads used to read the example pool concurrently
+    MAX_READ_WORKERS = 8
+    # Example posts must be longer than this many characters
+    MIN_POST_LENGTH = 50
+    # Default cap on a composed post's length: LinkedIn allows 3,000 characters (roughly 700
+    # tokens), so a longer completion can't be posted anyway. Override per call if needed
+    MAX_POST_TOKENS = 800
+    # Seconds a composed post is reused for an identical prompt
+    CACHE_TTL = 24 * 60 * 60
+    
+    def __init__(self, openai_api_key: str = None, model: str = None, use_cache: bool = True):
+        """Initialize the Post Composition Agent
+        
+        Args:
+            openai_api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            model: Model to use (defaults to COMPOSITION_MODEL)
+            use_cache: Reuse the post composed earlier for an identical prompt
+        """
         self.input_dir = Path("input")
         self.posts_dir = Path("posts")
+        self._example_posts = None
+        # Candidate post files in posts_dir, their parsed contents once read (None if
+        # unsuitable), and the directory mtime they were listed at
+        self._post_files = None
+        self._posts_cache = {}
+        self._posts_dir_mtime = None
         
-        # Use provided API key or get from environment
-        if openai_api_key:
-            self.openai_api_key = openai_api_key
-        else:
-            import os
-            from dotenv import load_dotenv
-            load_dotenv()
-            self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        
-        # Use provided model or get from environment
-        if model:
-            self.model = model
-        else:
-            import os
-            from dotenv import load_dotenv
-            load_dotenv()
-            self.model = os.getenv("COMPOSITION_MODEL", "gpt-4o")
+        # Use provided API key and model or get them from environment
+        self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        self.model = model or os.getenv("COMPOSITION_MODEL", "gpt-4o")
         
         if not self.openai_api_key:
             raise Exception("OPENAI_API_KEY not found. Please set it in .env file or pass it directly.")
         
+        # Re-running with the same context (e.g. while debugging) returns the earlier post instead of another model
+        # call, even though each run samples its own example posts
+        self.response_cache = ResponseCache() if use_cache else None
+        
         # Initialize agent with OpenAI model
         try:
-            from strands.models.openai import OpenAIModel
+            openai_model = self._create_model()
             
-            openai_model = OpenAIModel(
-                client_args={"api_key": self.openai_api_key},
-                model_id=self.model,
-                params={"temperature": 0.7, "max_tokens": 2000}
-            )
-            
-            self.agent = Agent(
-                system_prompt="""You are an expert LinkedIn content creator specializing in generating authentic, engaging posts that perfectly match a user's writing style and voice.
+            self.system_prompt = """You are an expert LinkedIn content creator specializing in generating authentic, engaging posts that perfectly match a user's writing style and voice.
 
 Your job is to:
 1. Synthesize information from multiple sources (instructions, link analysis, research, style guide)
@@ -71,32 +113,44 @@ Key principles:
 - Integrate research and link content seamlessly
 - Focus on professional value and insights
 - Avoid obvious AI-generated language patterns
-- Create content that sparks genuine professional discussion""",
+- Create content that sparks genuine professional discussion"""
+            
+            self.agent = Agent(
+                system_prompt=self.system_prompt,
                 model=openai_model,
                 tools=[]  # No external tools needed for composition
             )
             
-            print("✅ Post Composition Agent initialized with OpenAI API")
-            print(f"✍️ Using model: {self.model}")
+            logger.info("✅ Post Composition Agent initialized with OpenAI API")
+            logger.info("✍️ Using model: %s", self.model)
             
         except Exception as e:
             raise Exception(f"Failed to initialize Post Composition Agent: {e}")
     
+    def _create_model(self, max_tokens: Optional[int] = None):
+        """Create the OpenAI model used for composition (capped at MAX_POST_TOKENS by default)"""
+        from strands.models.openai import OpenAIModel
+        
+        return OpenAIModel(
+            client_args=openai_client_args(self.openai_api_key),
+            model_id=self.model,
+            params={"temperature": 0.7, "max_tokens": max_tokens or self.MAX_POST_TOKENS}
+        )
+    
     def load_style_analysis(self) -> str:
         """Load the user's writing style analysis"""
         style_file = self.input_dir / "linkedin_style_prompt.txt"
         
         if not style_file.exists():
-            print("⚠️ Style analysis not found, using generic guidelines")
+            logger.warning("⚠️ Style analysis not found, using generic guidelines")
             return "Write in a professional, engaging LinkedIn style."
         
         try:
-            with open(style_file, 'r', encoding='utf-8') as f:
-                style_analysis = f.read().strip()
-            print(f"✅ Loaded style analysis ({len(style_analysis)} characters)")
+            style_analysis = read_text_cached(style_file)
+            logger.info("✅ Loaded style analysis (%d characters)", len(style_analysis))
             return style_analysis
         except Exception as e:
-            print(f"❌ Error loading style analysis: {e}")
+            logger.error("❌ Error loading style analysis: %s", e)
             return "Write in a professional, engaging LinkedIn style."
     
     def load_base_prompt(self) -> str:
@@ -104,65 +158,123 @@ Key principles:
         prompt_file = self.input_dir / "prompt.txt"
         
         if not prompt_file.exists():
-            print("⚠️ Base prompt not found, using default")
+            logger.warning("⚠️ Base prompt not found, using default")
             return "Generate an engaging LinkedIn post based on the provided instructions."
         
         try:
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                base_prompt = f.read().strip()
-            print(f"✅ Loaded base prompt ({len(base_prompt)} characters)")
+            base_prompt = read_text_cached(prompt_file)
+            logger.info("✅ Loaded base prompt (%d characters)", len(base_prompt))
             return base_prompt
         except Exception as e:
-            print(f"❌ Error loading base prompt: {e}")
+            logger.error("❌ Error loading base prompt: %s", e)
             return "Generate an engaging LinkedIn post based on the provided instructions."
     
+    def _recent_post_files(self) -> List[Path]:
+        """The most recently modified post files, newest first, capped at EXAMPLE_POOL_SIZE"""
+        # scandir yields file types with the listing, so only .txt files are stat'ed for their mtime
+        files = []
+        with os.scandir(self.posts_dir) as entries:
+            for entry in entries:
+                if not (entry.name.endswith('.txt') and entry.is_file()):
+                    continue
+                stat = entry.stat()
+                # A file this small can't hold a post over MIN_POST_LENGTH, so it's never opened
+                if stat.st_size <= self.MIN_POST_LENGTH:
+                    continue
+                files.append((stat.st_mtime, entry.path))
+        return [Path(path) for _, path in heapq.nlargest(self.EXAMPLE_POOL_SIZE, files)]
+    
+    def _read_post(self, post_file: Path) -> Optional[Dict[str, str]]:
+        """Read a post file and extract its content, or None if it isn't a suitable example"""
+        try:
+            with post_file.open('rb') as f:
+                # Failed extractions are saved as just the error message, so they're
+                # recognisable from the first bytes without reading the rest of the file
+                head = f.read(64)
+                if head.lstrip().startswith(b"Error extracting"):
+                    return None
+                content = (head + f.read()).decode('utf-8')
+            
+            # Extract the actual post content (a plain substring check first spares the
+            # regex a full scan of files without a CONTENT: section)
+            content_match = _CONTENT_RE.search(content) if "CONTENT:" in content else None
+            if content_match:
+                post_content = content_match.group(1).strip()
+            else:
+                post_content = content.strip()
+                post_content = _EXCESS_BLANK_LINES_RE.sub('\n\n', post_content)
+            
+            # Filter suitable posts
+            if len(post_content) > self.MIN_POST_LENGTH and not post_content.startswith("Error extracting"):
+                return {
+                    'filename': post_file.name,
+                    'content': post_content
+                }
+                
+        except Exception as e:
+            logger.warning("⚠️ Error reading post %s: %s", post_file.name, e)
+        return None
+    
     def load_example_posts(self, count: int = 4) -> List[Dict[str, str]]:
         """Load random example posts for few-shot learning"""
-        if not self.posts_dir.exists():
-            print("⚠️ Posts directory not found")
+        try:
+            posts_dir_mtime = self.posts_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.warning("⚠️ Posts directory not found")
             return []
         
-        posts = []
-        for post_file in self.posts_dir.glob("*.txt"):
-            try:
-                with open(post_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Extract the actual post content
-                content_match = re.search(r'CONTENT:\s*\n-+\s*\n(.*?)(?:\n\nRAW DATA|$)', content, re.DOTALL)
-                if content_match:
-                    post_content = content_match.group(1).strip()
-                else:
-                    post_content = content.strip()
-                    post_content = re.sub(r'\n\s*\n\s*\n+', '\n\n', post_content)
-                
-                # Filter suitable posts
-                if len(post_content) > 50 and not post_content.startswith("Error extracting"):
-                    posts.append({
-                        'filename': post_file.name,
-                        'content': post_content
-                    })
-                    
-            except Exception as e:
-                print(f"⚠️ Error reading post {post_file.name}: {e}")
-                continue
-        
-        # Select random posts
-        if posts:
-            selected_count = min(count, len(posts))
-            selected_count = max(3, min(selected_count, 4))  # 3-4 posts
-            selected_posts = random.sample(posts, selected_count)
-            
-            print(f"📚 Selected {len(selected_posts)} example posts for style reference")
+        # Adding, removing or renaming a post changes the directory's mtime, so until then the
+        # file listing and any posts already parsed are reused without touching the files again
+        if self._post_files is None or posts_dir_mtime != self._posts_dir_mtime:
+            self._post_files = self._recent_post_files()
+            self._posts_cache = {}
+            self._posts_dir_mtime = posts_dir_mtime
+        
+        # Sample files before reading them, so only the chosen posts are parsed; unsuitable
+        # picks are replaced from the rest of the pool until enough posts are found
+        wanted = max(3, min(count, 4))  # 3-4 posts
+        remaining = random.sample(self._post_files, len(self._post_files))
+        selected_posts = []
+        while remaining and len(selected_posts) < wanted:
+            picks = remaining[:wanted - len(selected_posts)]
+            del remaining[:len(picks)]
+            unread = [post_file for post_file in picks if post_file not in self._posts_cache]
+            # File reads are independent and I/O-bound, so they overlap in a small thread pool
+            with ThreadPoolExecutor(max_workers=self.MAX_READ_WORKERS) as executor:
+                self._posts_cache.update(zip(unread, executor.map(self._read_post, unread)))
+            selected_posts.extend(self._posts_cache[post_file] for post_file in picks if self._posts_cache[post_file])
+        
+        if selected_posts:
+            logger.info("📚 Selected %d example posts for style reference", len(selected_posts))
             for post in selected_posts:
                 preview = post['content'][:80] + "..." if len(post['content']) > 80 else post['content']
-                print(f"   - {post['filename']}: {preview}")
+                logger.info("   - %s: %s", post['filename'], preview)
                 
             return selected_posts
         else:
-            print("⚠️ No suitable example posts found")
+            logger.warning("⚠️ No suitable example posts found")
             return []
     
+    def load_prompt_materials(self) -> Dict[str, Any]:
+        """
+        Load the supporting materials for a composition prompt
+        
+        These only depend on files on disk, so they can be loaded ahead of time (e.g. while
+        research is still running) and passed to build_post_prompt or compose_linkedin_post.
+        
+        Returns:
+            Dictionary with style_analysis, base_prompt and example_posts
+        """
+        # Examples are sampled once per agent, so they stay part of the shared prompt prefix
+        if self._example_posts is None:
+            self._example_posts = self.load_example_posts()
+        
+        return {
+            'style_analysis': self.load_style_analysis(),
+            'base_prompt': self.load_base_prompt(),
+            'example_posts': self._example_posts
+        }
+    
     def build_comprehensive_context(self, instructions: str, link_analysis: Dict[str, Any], research_findings: Dict[str, Any]) -> str:
         """
         Build comprehensive context from all available sources
@@ -175,6 +287,8 @@ Key principles:
         Returns:
             Formatted context string for the composition agent
         """
+        # Unordered collections (themes, topics, angles) are listed sorted, so the same
+        # findings always produce the same prompt bytes and hit the provider's prompt cache
         context_parts = []
         
         # Original instructions
@@ -184,26 +298,27 @@ Key principles:
         if link_analysis and link_analysis.get('successful_analyses', 0) > 0:
             context_parts.append(f"\nLINK ANALYSIS INSIGHTS:")
             context_parts.append(f"- URLs analyzed: {link_analysis.get('total_urls', 0)}")
-            context_parts.append(f"- Main themes: {', '.join(link_analysis.get('aggregated_themes', []))}")
+            context_parts.append(f"- Main themes: {', '.join(sorted(link_analysis.get('aggregated_themes', [])))}")
             
             # Key points from links
             key_points = link_analysis.get('all_key_points', [])
             if key_points:
                 context_parts.append("- Key points from linked content:")
-                for point in key_points[:5]:  # Limit to top 5 points
+                for point in islice(key_points, 5):  # Limit to top 5 points
                     context_parts.append(f"  • {point}")
             
             # Relevant quotes
             quotes = link_analysis.get('all_quotes', [])
             if quotes:
                 context_parts.append("- Relevant quotes:")
-                for quote in quotes[:3]:  # Limit to top 3 quotes
+                for quote in islice(quotes, 3):  # Limit to top 3 quotes
                     context_parts.append(f"  • \"{quote}\"")
         
         # Research findings
-        if research_findings and research_findings.get('topics_researched'):
+        topics = research_findings.get('topics_researched') if research_findings else None
+        if topics:
             context_parts.append(f"\nRESEARCH INSIGHTS:")
-            context_parts.append(f"- Topics researched: {', '.join(research_findings.get('topics_researched', []))}")
+            context_parts.append(f"- Topics researched: {', '.join(sorted(topics))}")
             
             aggregated = research_findings.get('aggregated_insights', {})
             
@@ -211,49 +326,50 @@ Key principles:
             trends = aggregated.get('all_trends', [])
             if trends:
                 context_parts.append("- Current trends:")
-                for trend in trends[:4]:  # Limit to top 4 trends
+                for trend in islice(trends, 4):  # Limit to top 4 trends
                     context_parts.append(f"  • {trend}")
             
             # Key statistics
             statistics = aggregated.get('all_statistics', [])
             if statistics:
                 context_parts.append("- Supporting statistics:")
-                for stat in statistics[:3]:  # Limit to top 3 stats
+                for stat in islice(statistics, 3):  # Limit to top 3 stats
                     context_parts.append(f"  • {stat}")
             
             # LinkedIn angles
             angles = aggregated.get('all_angles', [])
             if angles:
                 context_parts.append("- Professional angles:")
-                for angle in angles[:3]:  # Limit to top 3 angles
+                for angle in sorted(islice(angles, 3)):  # Limit to top 3 angles
                     context_parts.append(f"  • {angle}")
             
             # Actionable insights
             insights = aggregated.get('all_actionable_insights', [])
             if insights:
                 context_parts.append("- Actionable insights:")
-                for insight in insights[:3]:  # Limit to top 3 insights
+                for insight in islice(insights, 3):  # Limit to top 3 insights
                     context_parts.append(f"  • {insight}")
         
         return "\n".join(context_parts)
     
-    def compose_linkedin_post(self, context: Dict[str, Any], debug: bool = False) -> str:
+    def build_post_prompt(self, context: Dict[str, Any], debug: bool = False, materials: Dict[str, Any] = None) -> str:
         """
-        Generate the final LinkedIn post using all available context
+        Build the complete composition prompt from all available context
         
         Args:
             context: Dictionary containing all context information
-            debug: If True, prints the full prompt being sent to the model
+            debug: If True, prints the full prompt
+            materials: Preloaded result of load_prompt_materials (loaded now if not given)
             
         Returns:
-            Generated LinkedIn post
+            Prompt to send to the composition model
         """
-        print("✍️ Composing LinkedIn post...")
-        
         # Load all supporting materials
-        style_analysis = self.load_style_analysis()
-        base_prompt = self.load_base_prompt()
-        example_posts = self.load_example_posts()
+        if materials is None:
+            materials = self.load_prompt_materials()
+        style_analysis = materials['style_analysis']
+        base_prompt = materials['base_prompt']
+        example_posts = materials['example_posts']
         
         # Build comprehensive context
         comprehensive_context = self.build_comprehensive_context(
@@ -262,46 +378,106 @@ Key principles:
             context['research_findings']
         )
         
-        # Build the complete prompt
-        full_prompt = f"""{base_prompt}
-
-WRITING STYLE GUIDE:
-{style_analysis}
-
-COMPREHENSIVE CONTEXT:
-{comprehensive_context}
-
-EXAMPLE POSTS (for style reference):
-"""
+        # Build the complete prompt. Everything up to the comprehensive context is the same for
+        # every post in a session, so it comes first and the provider can cache it as a prefix
+        prompt_parts = [
+            base_prompt,
+            "",
+            "WRITING STYLE GUIDE:",
+            style_analysis,
+            "",
+            "EXAMPLE POSTS (for style reference):",
+        ]
         
         # Add example posts
         for i, post in enumerate(example_posts, 1):
-            full_prompt += f"\nExample {i}:\n{post['content']}\n"
+            prompt_parts.extend(["", f"Example {i}:", post['content']])
         
-        # Add final instruction
-        full_prompt += f"""
-Based on all the information above, generate a LinkedIn post that:
-1. Addresses the original instructions completely
-2. Incorporates insights from the link analysis naturally
-3. Weaves in research findings and trends seamlessly  
-4. Maintains the exact writing style demonstrated in the examples
-5. Creates engaging, authentic content that doesn't sound AI-generated
-6. Follows LinkedIn best practices for professional engagement
-
-Generate the LinkedIn post now:"""
+        # Add final instruction, then the context for this post
+        prompt_parts.extend([
+            "",
+            _COMPOSITION_INSTRUCTIONS,
+            "",
+            "COMPREHENSIVE CONTEXT:",
+            comprehensive_context,
+            "",
+            "Generate the LinkedIn post now:",
+        ])
+        full_prompt = "\n".join(prompt_parts)
 
         # Debug: Print the full prompt if requested
         if debug:
-            print("\n" + "="*80)
-            print("🐛 DEBUG: FULL PROMPT BEING SENT TO MODEL")
-            print("="*80)
-            print(full_prompt)
-            print("="*80)
-            print()
+            logger.info("\n" + "="*80)
+            logger.info("🐛 DEBUG: FULL PROMPT BEING SENT TO MODEL")
+            logger.info("="*80)
+            logger.info(full_prompt)
+            logger.info("="*80)
+            logger.info("📏 Prompt size: %d tokens\n", count_tokens(full_prompt, self.model))
+        
+        return full_prompt
+    
+    def _cache_key(self, context: Dict[str, Any], materials: Dict[str, Any], max_tokens: Optional[int] = None) -> str:
+        """
+        Cache key covering the model settings, the post's context and the style materials
+        
+        The example posts are left out: they're sampled at random in every process, so keying
+        on the full prompt would make each new run miss for the same context.
+        """
+        canonical_context = json.dumps(
+            {key: context.get(key) for key in ('instructions', 'link_analysis', 'research_findings')},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return ResponseCache.make_key(
+            "composition", self.model, str(max_tokens or self.MAX_POST_TOKENS), self.system_prompt,
+            materials['base_prompt'], materials['style_analysis'], canonical_context
+        )
+    
+    def _get_cached_post(self, context: Dict[str, Any], materials: Dict[str, Any],
+                         max_tokens: Optional[int] = None) -> Optional[str]:
+        """Return a still-fresh post composed earlier for the same context, if there is one"""
+        if not self.response_cache:
+            return None
+        return self.response_cache.get(self._cache_key(context, materials, max_tokens), max_age=self.CACHE_TTL)
+    
+    def _cache_post(self, context: Dict[str, Any], materials: Dict[str, Any], post: str,
+                    max_tokens: Optional[int] = None):
+        """Store a composed post for the same context later on"""
+        if self.response_cache and post:
+            self.response_cache.set(self._cache_key(context, materials, max_tokens), post)
+    
+    def compose_linkedin_post(self, context: Dict[str, Any], debug: bool = False, materials: Dict[str, Any] = None,
+                              max_tokens: Optional[int] = None) -> str:
+        """
+        Generate the final LinkedIn post using all available context
+        
+        Args:
+            context: Dictionary containing all context information
+            debug: If True, prints the full prompt being sent to the model
+            materials: Preloaded result of load_prompt_materials (loaded now if not given)
+            max_tokens: Cap on the post's length in tokens (MAX_POST_TOKENS if not given)
+            
+        Returns:
+            Generated LinkedIn post
+        """
+        logger.info("✍️ Composing LinkedIn post...")
+        
+        if materials is None:
+            materials = self.load_prompt_materials()
+        full_prompt = self.build_post_prompt(context, debug=debug, materials=materials)
+        
+        cached_post = self._get_cached_post(context, materials, max_tokens)
+        if cached_post is not None:
+            logger.info("♻️ Reusing the post composed earlier for the same context")
+            return cached_post
 
         try:
+            # A different length cap needs its own model; the shared agent uses the default
+            agent = self.agent
+            if max_tokens:
+                agent = Agent(system_prompt=self.system_prompt, model=self._create_model(max_tokens))
+            
             # Generate the post
-            response = self.agent(full_prompt)
+            response = agent(full_prompt)
             
             # Extract the generated content
             if hasattr(response, 'content'):
@@ -311,12 +487,188 @@ Generate the LinkedIn post now:"""
             else:
                 generated_post = str(response).strip()
             
-            print("✅ LinkedIn post composed successfully")
+            self._cache_post(context, materials, generated_post, max_tokens)
+            logger.info("✅ LinkedIn post composed successfully")
             return generated_post
             
         except Exception as e:
-            print(f"❌ Error composing LinkedIn post: {e}")
+            logger.error("❌ Error composing LinkedIn post: %s", e)
             return f"Error generating LinkedIn post: {e}"
+    
+    async def acompose_linkedin_post_stream(self, context: Dict[str, Any], debug: bool = False,
+                                            materials: Dict[str, Any] = None,
+                                            max_tokens: Optional[int] = None) -> AsyncIterator[str]:
+        """
+        Generate the final LinkedIn post, yielding its text as the model produces it
+        
+        Args:
+            context: Dictionary containing all context information
+            debug: If True, prints the full prompt being sent to the model
+            materials: Preloaded result of load_prompt_materials (loaded now if not given)
+            max_tokens: Cap on the post's length in tokens (MAX_POST_TOKENS if not given)
+            
+        Yields:
+            Chunks of the generated post, in order
+            
+        Raises:
+            Exception: If composition fails. Part of the post may already have been yielded,
+                so the error is raised rather than yielded as more post text
+        """
+        logger.info("✍️ Composing LinkedIn post...")
+        
+        if materials is None:
+            materials = self.load_prompt_materials()
+        full_prompt = self.build_post_prompt(context, debug=debug, materials=materials)
+        
+        cached_post = self._get_cached_post(context, materials, max_tokens)
+        if cached_post is not None:
+            logger.info("♻️ Reusing the post composed earlier for the same context")
+            yield cached_post + "\n"
+            return
+        
+        # A fresh agent per stream: its async client is bound to the caller's event loop, and the
+        # chunks go to the caller rather than being printed by the default callback handler
+        model = self._create_model(max_tokens)
+        agent = Agent(system_prompt=self.system_prompt, model=model, callback_handler=None)
+        
+        try:
+            chunks = []
+            async for event in agent.stream_async(full_prompt):
+                if "data" in event:
+                    chunks.append(event["data"])
+                    yield event["data"]
+            # End the line, so output that follows the post doesn't continue it
+            yield "\n"
+            
+        except Exception as e:
+            logger.error("❌ Error composing LinkedIn post: %s", e)
+            raise
+        finally:
+            await model.client.close()
+        
+        self._cache_post(context, materials, "".join(chunks).strip(), max_tokens)
+        logger.info("✅ LinkedIn post composed successfully")
+    
+    async def acompose_batch(self, contexts: List[Dict[str, Any]], max_concurrency: int = 4) -> List[str]:
+        """Generate one LinkedIn post per context, composing up to max_concurrency at once"""
+        # Materials are loaded once for the whole batch, so every prompt shares the same prefix
+        materials = self.load_prompt_materials()
+        prompts = [self.build_post_prompt(context, materials=materials) for context in contexts]
+        
+        # One model, and so one async client, serves the whole batch on this event loop
+        model = self._create_model()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def compose(index: int, context: Dict[str, Any], prompt: str) -> str:
+            cached_post = self._get_cached_post(context, materials)
+            if cached_post is not None:
+                logger.info("♻️ Reusing the post composed earlier for post %d", index + 1)
+                return cached_post
+            
+            async with semaphore:
+                try:
+                    # A fresh agent per post keeps each conversation to its own prompt
+                    agent = Agent(system_prompt=self.system_prompt, model=model, callback_handler=None)
+                    response = await agent.invoke_async(prompt)
+                    post = str(response).strip()
+                    self._cache_post(context, materials, post)
+                    return post
+                except Exception as e:
+                    logger.error("❌ Error composing LinkedIn post %d: %s", index + 1, e)
+                    return f"Error generating LinkedIn post: {e}"
+        
+        logger.info("✍️ Composing %d LinkedIn posts (up to %d at once)...", len(contexts), max_concurrency)
+        try:
+            # gather returns results in input order regardless of completion order
+            posts = await asyncio.gather(
+                *(compose(index, context, prompt) for index, (context, prompt) in enumerate(zip(contexts, prompts)))
+            )
+        finally:
+            await model.client.close()
+        
+        logger.info("✅ Composed %d LinkedIn posts", len(posts))
+        return posts
+    
+    def compose_batch(self, contexts: List[Dict[str, Any]], use_batch_api: bool = True) -> List[str]:
+        """
+        Generate one LinkedIn post per context
+        
+        Args:
+            contexts: Composition contexts (instructions, link_analysis, research_findings)
+            use_batch_api: Submit all compositions as a single OpenAI Batch API job (half
+                price, but may take up to 24 hours) instead of composing them concurrently
+            
+        Returns:
+            Generated posts in the same order as contexts
+        """
+        if not use_batch_api:
+            return asyncio.run(self.acompose_batch(contexts))
+        
+        from openai import OpenAI
+        
+        logger.info("✍️ Composing %d LinkedIn posts (batch mode)...", len(contexts))
+        client = OpenAI(**openai_client_args(self.openai_api_key))
+        
+        try:
+            batch_input = "\n".join(
+                json.dumps({
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": [
+                            {"role": "system", "content": self.system_prompt},
+                            {"role": "user", "content": self.build_post_prompt(context)}
+                        ],
+                        "temperature": 0.7,
+                        "max_tokens": self.MAX_POST_TOKENS
+                    }
+                })
+                for index, context in enumerate(contexts)
+            )
+            input_file = client.files.create(
+                file=("composition_batch.jsonl", batch_input.encode("utf-8")),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info("📦 Submitted composition batch: %s", batch.id)
+            
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(self.BATCH_POLL_INTERVAL)
+                batch = client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                raise Exception(f"Batch {batch.id} finished with status '{batch.status}'")
+            
+            # Output lines can arrive in any order, so route them back by custom_id
+            responses = {}
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if line.strip():
+                    result = json.loads(line)
+                    responses[result["custom_id"]] = result
+                    
+        except Exception as e:
+            logger.error("❌ Error composing LinkedIn posts in batch: %s", e)
+            return [f"Error generating LinkedIn post: {e}"] * len(contexts)
+        
+        posts = []
+        for index in range(len(contexts)):
+            try:
+                result = responses[str(index)]
+                if result.get("error"):
+                    raise Exception(result["error"])
+                posts.append(result["response"]["body"]["choices"][0]["message"]["content"].strip())
+            except Exception as e:
+                logger.error("❌ Error composing LinkedIn post %d: %s", index + 1, e)
+                posts.append(f"Error generating LinkedIn post: {e}")
+        
+        logger.info("✅ Composed %d LinkedIn posts", len(posts))
+        return posts
 
 
 def main():
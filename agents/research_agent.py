@@ -8,14 +8,148 @@ and link analysis. Generates comprehensive insights and supporting information.
 
 import json
 import re
-from typing import List, Dict, Any
+import asyncio
+import httpx
+from typing import List, Dict, Any, Optional
 from strands import Agent
 from tavily import TavilyClient
 
+from .json_extraction import extract_json_array, extract_json_object
+from .logging_config import get_logger
+from .openai_client import openai_client_args
+from .response_cache import ResponseCache
+
+logger = get_logger(__name__)
+
+# System prompts, with and without web search results to draw on
+_WEB_SEARCH_SYSTEM_PROMPT = """You are a research specialist focused on generating comprehensive topic insights for LinkedIn content creation. Your job is to:
+
+1. Extract key topics and themes from instructions and existing analysis
+2. Analyze web search results provided to you to gather current information and trends
+3. Provide industry context and current trends for each topic based on search results
+4. Generate supporting statistics, expert opinions, and data points from reliable sources
+5. Identify angles and perspectives that would resonate on LinkedIn
+6. Create actionable insights for content creation
+7. Focus on professional, business-relevant information
+
+You will be provided with web search results for each topic. Use this information to provide comprehensive, current insights. Always structure your research in a clear, organized format that can be easily used for content creation."""
+
+_KNOWLEDGE_SYSTEM_PROMPT = """You are a research specialist focused on generating comprehensive topic insights for LinkedIn content creation. Your job is to:
+
+1. Extract key topics and themes from instructions and existing analysis
+2. Provide industry context and current trends for each topic based on your knowledge
+3. Generate supporting statistics, expert opinions, and data points from reliable sources
+4. Identify angles and perspectives that would resonate on LinkedIn
+5. Create actionable insights for content creation
+6. Focus on professional, business-relevant information
+
+Use your extensive knowledge to provide comprehensive insights. Always structure your research in a clear, organized format that can be easily used for content creation."""
+
+# Static opening of each topic research prompt. It comes before the topic, context and search
+# results so that it forms an identical prefix across requests for provider-side prompt caching
+_WEB_RESEARCH_INSTRUCTIONS = """Conduct comprehensive research on the topic below for LinkedIn content creation using the web search results provided after it.
+
+Provide comprehensive research insights in the following JSON format:
+
+{
+    "topic": "The topic being researched",
+    "current_trends": [
+        "Current trend 1 with recent evidence from search results",
+        "Current trend 2 with recent evidence from search results"
+    ],
+    "key_statistics": [
+        "Recent statistic 1 with source from search results",
+        "Recent statistic 2 with source from search results"
+    ],
+    "industry_implications": [
+        "Business implication 1 based on current information",
+        "Business implication 2 based on current information"
+    ],
+    "expert_perspectives": [
+        "Recent expert viewpoint 1 from search results",
+        "Recent expert viewpoint 2 from search results"
+    ],
+    "linkedin_angles": [
+        "Angle 1: Why this matters to professionals right now",
+        "Angle 2: How this affects business strategy today",
+        "Angle 3: Current career development implications"
+    ],
+    "supporting_arguments": [
+        "Argument 1 supported by recent developments",
+        "Argument 2 supported by recent developments"
+    ],
+    "potential_controversies": [
+        "Current debate point 1 from recent discussions",
+        "Current debate point 2 from recent discussions"
+    ],
+    "actionable_insights": [
+        "Actionable insight 1 based on current information",
+        "Actionable insight 2 based on current information"
+    ]
+}
+
+Focus on the most recent information from the search results."""
+
+_KNOWLEDGE_RESEARCH_INSTRUCTIONS = """Based on your existing knowledge, conduct comprehensive research on the topic below for LinkedIn content creation.
+
+Using your training data and knowledge base, please provide comprehensive research insights in the following JSON format:
+
+{
+    "topic": "The topic being researched",
+    "current_trends": [
+        "Current trend 1 related to this topic based on your knowledge",
+        "Current trend 2 related to this topic based on your knowledge"
+    ],
+    "key_statistics": [
+        "Relevant statistic 1 (with approximate source if known)",
+        "Relevant statistic 2 (with approximate source if known)"
+    ],
+    "industry_implications": [
+        "Business implication 1",
+        "Business implication 2"
+    ],
+    "expert_perspectives": [
+        "Expert viewpoint 1 based on known industry opinions",
+        "Expert viewpoint 2 based on known industry opinions"
+    ],
+    "linkedin_angles": [
+        "Angle 1: Why this matters to professionals",
+        "Angle 2: How this affects business strategy",
+        "Angle 3: Career development implications"
+    ],
+    "supporting_arguments": [
+        "Argument 1 supporting main thesis",
+        "Argument 2 supporting main thesis"
+    ],
+    "potential_controversies": [
+        "Debate point 1",
+        "Debate point 2"
+    ],
+    "actionable_insights": [
+        "Actionable insight 1 for readers",
+        "Actionable insight 2 for readers"
+    ]
+}
+
+Focus on information from your training data that would be valuable for LinkedIn content creation and professional discussion."""
+
 
 class ResearchAgent:
-    def __init__(self, openai_api_key: str = None, model: str = None):
-        """Initialize the Research Agent with topic analysis capabilities"""
+    # Seconds cached topics and topic research stay valid, since web search results change over time
+    CACHE_TTL = 24 * 60 * 60
+    # Bump when the research prompts change so older cached results are not reused
+    RESEARCH_PROMPT_VERSION = "2"
+    
+    def __init__(self, openai_api_key: str = None, model: str = None, use_cache: bool = True,
+                 http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize the Research Agent with topic analysis capabilities
+        
+        Args:
+            openai_api_key: OpenAI API key (defaults to OPENAI_API_KEY)
+            model: Model to use (defaults to the agent's model environment variable)
+            use_cache: Reuse results from previous runs
+            http_client: Connection pool shared with other agents; its owner closes it
+        """
         
         # Use provided API key or get from environment
         if openai_api_key:
@@ -38,6 +172,9 @@ class ResearchAgent:
         if not self.openai_api_key:
             raise Exception("OPENAI_API_KEY not found. Please set it in .env file or pass it directly.")
         
+        # Extracted topics and topic research are reused across runs instead of repeating the searches and model calls
+        self.response_cache = ResponseCache() if use_cache else None
+        
         # Check if Tavily API key is available
         import os
         from dotenv import load_dotenv
@@ -47,57 +184,85 @@ class ResearchAgent:
         
         if self.has_web_search:
             self.tavily_client = TavilyClient(api_key=self.tavily_api_key)
-            print("✅ Tavily web search enabled")
+            logger.info("✅ Tavily web search enabled")
         else:
             self.tavily_client = None
-            print("⚠️ Tavily API key not configured. Research will use knowledge-based analysis only.")
-            print("   To enable web search, get an API key from https://www.tavily.com/ and set TAVILY_API_KEY in .env")
+            logger.warning("⚠️ Tavily API key not configured. Research will use knowledge-based analysis only.")
+            logger.warning("   To enable web search, get an API key from https://www.tavily.com/ and set TAVILY_API_KEY in .env")
         
-        # Initialize agent with OpenAI model
-        try:
-            from strands.models.openai import OpenAIModel
-            
-            openai_model = OpenAIModel(
-                client_args={"api_key": self.openai_api_key},
-                model_id=self.model,
-                params={"temperature": 0.3, "max_tokens": 2000}
-            )
-            
-            # Configure system prompt based on web search availability
-            if self.has_web_search:
-                system_prompt = """You are a research specialist focused on generating comprehensive topic insights for LinkedIn content creation. Your job is to:
-
-1. Extract key topics and themes from instructions and existing analysis
-2. Analyze web search results provided to you to gather current information and trends
-3. Provide industry context and current trends for each topic based on search results
-4. Generate supporting statistics, expert opinions, and data points from reliable sources
-5. Identify angles and perspectives that would resonate on LinkedIn
-6. Create actionable insights for content creation
-7. Focus on professional, business-relevant information
-
-You will be provided with web search results for each topic. Use this information to provide comprehensive, current insights. Always structure your research in a clear, organized format that can be easily used for content creation."""
-            else:
-                system_prompt = """You are a research specialist focused on generating comprehensive topic insights for LinkedIn content creation. Your job is to:
-
-1. Extract key topics and themes from instructions and existing analysis
-2. Provide industry context and current trends for each topic based on your knowledge
-3. Generate supporting statistics, expert opinions, and data points from reliable sources
-4. Identify angles and perspectives that would resonate on LinkedIn
-5. Create actionable insights for content creation
-6. Focus on professional, business-relevant information
-
-Use your extensive knowledge to provide comprehensive insights. Always structure your research in a clear, organized format that can be easily used for content creation."""
-            
-            self.agent = Agent(
-                system_prompt=system_prompt,
-                model=openai_model
+        # Pooled HTTP client and model for the async path, bound to the event loop they were created in
+        self._shared_http_client = http_client
+        self._http_client = None
+        self._pooled_model = None
+        self._pool_loop = None
+        
+        # Configure system prompt based on web search availability. Models are built per event
+        # loop on first use (see _get_pooled_model), so construction makes no OpenAI client
+        self.system_prompt = _WEB_SEARCH_SYSTEM_PROMPT if self.has_web_search else _KNOWLEDGE_SYSTEM_PROMPT
+        
+        logger.info("✅ Research Agent initialized with OpenAI API")
+        logger.info("🔍 Using model: %s", self.model)
+    
+    def _create_model(self, http_client: Optional[httpx.AsyncClient] = None):
+        """Create the OpenAI model used for research"""
+        from strands.models.openai import OpenAIModel
+        
+        return OpenAIModel(
+            client_args=openai_client_args(self.openai_api_key, http_client),
+            model_id=self.model,
+            params={"temperature": 0.3, "max_tokens": 2000}
+        )
+    
+    def _create_agent(self, model) -> Agent:
+        """Create an agent with a fresh conversation on the given OpenAI model"""
+        # Topics are researched concurrently, so responses aren't echoed to stdout as they stream
+        return Agent(system_prompt=self.system_prompt, model=model, callback_handler=None)
+    
+    def _get_pooled_model(self):
+        """Model whose requests share one keep-alive connection pool in the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._pool_loop is not loop:
+            # Connections can't be reused across event loops, so start a new pool for this one
+            self._http_client = self._shared_http_client or httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
             )
-            
-            print("✅ Research Agent initialized with OpenAI API")
-            print(f"🔍 Using model: {self.model}")
-            
-        except Exception as e:
-            raise Exception(f"Failed to initialize Research Agent: {e}")
+            self._pooled_model = self._create_model(http_client=self._http_client)
+            self._pool_loop = loop
+        return self._pooled_model
+    
+    async def aclose(self):
+        """Close the pooled HTTP client used by the async research path (a shared one is left to its owner)"""
+        if self._http_client and self._http_client is not self._shared_http_client:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._pooled_model = None
+        self._pool_loop = None
+    
+    def _run_async(self, coroutine):
+        """Run a coroutine to completion, closing the pooled client before its event loop goes away"""
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    def _cache_key(self, *parts: str) -> str:
+        """Cache key covering everything that determines a research result"""
+        return ResponseCache.make_key("research", self.RESEARCH_PROMPT_VERSION, self.model, self.system_prompt, *parts)
+    
+    def _get_cached(self, key: str) -> Any:
+        """Return a still-fresh cached result, or None on a miss"""
+        if not self.response_cache:
+            return None
+        cached = self.response_cache.get(key, max_age=self.CACHE_TTL)
+        return json.loads(cached) if cached is not None else None
+    
+    def _cache(self, key: str, value: Any):
+        """Store a successfully parsed result for reuse"""
+        if self.response_cache:
+            self.response_cache.set(key, json.dumps(value))
     
     def extract_topics(self, instructions: str, link_analysis: Dict[str, Any]) -> List[str]:
         """
@@ -110,6 +275,10 @@ Use your extensive knowledge to provide comprehensive insights. Always structure
         Returns:
             List of key topics to research
         """
+        return self._run_async(self.aextract_topics(instructions, link_analysis))
+    
+    async def aextract_topics(self, instructions: str, link_analysis: Dict[str, Any]) -> List[str]:
+        """Extract key topics to research, without blocking the event loop"""
         # Extract topics from instructions using AI, but always include any topics explicitly listed under a heading like
         # 'additional topics for research' or similar in the instructions file. These should be weighted and prioritized in the output.
         topic_extraction_prompt = f"""
@@ -132,8 +301,15 @@ LINK ANALYSIS KEY POINTS:
 Return the topics as a simple JSON list: ["topic1", "topic2", "topic3"]
 """
 
+        cache_key = self._cache_key("topics", topic_extraction_prompt)
+        cached_topics = self._get_cached(cache_key)
+        if cached_topics is not None:
+            logger.info("♻️ Reusing %d cached topics for research", len(cached_topics))
+            return cached_topics
+        
         try:
-            response = self.agent(topic_extraction_prompt)
+            # Each call gets its own conversation, so concurrent research calls don't share history
+            response = await self._create_agent(self._get_pooled_model()).invoke_async(topic_extraction_prompt)
             
             # Extract response content
             if hasattr(response, 'content'):
@@ -142,9 +318,9 @@ Return the topics as a simple JSON list: ["topic1", "topic2", "topic3"]
                 response_text = str(response)
             
             # Try to parse JSON
-            json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
-            if json_match:
-                topics = json.loads(json_match.group())
+            topics = extract_json_array(response_text)
+            if topics is not None:
+                self._cache(cache_key, topics[:5])
             else:
                 # Fallback: extract topics from text
                 topics = []
@@ -159,14 +335,14 @@ Return the topics as a simple JSON list: ["topic1", "topic2", "topic3"]
                 if not topics:
                     topics = ['AI technology', 'Industry trends', 'Professional development']
             
-            print(f"🎯 Extracted {len(topics)} topics for research:")
+            logger.info("🎯 Extracted %d topics for research:", len(topics))
             for i, topic in enumerate(topics, 1):
-                print(f"   {i}. {topic}")
+                logger.info("   %d. %s", i, topic)
             
             return topics[:5]  # Limit to 5 topics maximum
             
         except Exception as e:
-            print(f"⚠️ Error extracting topics: {e}")
+            logger.warning("⚠️ Error extracting topics: %s", e)
             # Fallback topics based on common LinkedIn themes
             return ['Industry trends', 'Technology developments', 'Professional insights']
     
@@ -181,15 +357,28 @@ Return the topics as a simple JSON list: ["topic1", "topic2", "topic3"]
         Returns:
             Dictionary containing research findings for the topic
         """
-        print(f"🔍 Researching topic: {topic}")
+        return self._run_async(self.aresearch_topic(topic, context))
+    
+    async def aresearch_topic(self, topic: str, context: str) -> Dict[str, Any]:
+        """Research a single topic, without blocking the event loop so topics can be researched concurrently"""
+        logger.info("🔍 Researching topic: %s", topic)
+        
+        # Keyed on the topic rather than the final prompt, so a hit also skips the web search
+        cache_key = self._cache_key("topic", topic, context)
+        cached_research = self._get_cached(cache_key)
+        if cached_research is not None:
+            logger.debug("♻️ Using cached research for: %s", topic)
+            return cached_research
         
         # Perform web search if available
         search_results = ""
         if self.has_web_search:
             try:
-                print(f"🌐 Conducting web search for: {topic}")
+                logger.debug("🌐 Conducting web search for: %s", topic)
                 # Search for current information about the topic
-                search_response = self.tavily_client.search(
+                # The Tavily client is synchronous, so the search runs in a worker thread
+                search_response = await asyncio.to_thread(
+                    self.tavily_client.search,
                     query=f"{topic} recent developments trends 2024 2025",
                     search_depth="advanced",
                     max_results=5,
@@ -204,159 +393,30 @@ Return the topics as a simple JSON list: ["topic1", "topic2", "topic3"]
                         search_results += f"   URL: {result.get('url', 'No URL')}\n"
                         search_results += f"   Content: {result.get('content', 'No content')[:500]}...\n"
                         
-                    print(f"✅ Found {len(search_response['results'])} search results")
+                    logger.debug("✅ Found %d search results", len(search_response['results']))
                 else:
-                    print("⚠️ No search results found")
+                    logger.warning("⚠️ No search results found")
                     
             except Exception as e:
-                print(f"⚠️ Web search failed: {e}")
+                logger.warning("⚠️ Web search failed: %s", e)
                 search_results = ""
         
         if self.has_web_search and search_results:
-            research_prompt = f"""Conduct comprehensive research on the following topic for LinkedIn content creation using the provided web search results:
+            research_prompt = f"""{_WEB_RESEARCH_INSTRUCTIONS}
 
 TOPIC: {topic}
 
-CONTEXT: {context[:1000]}  # Additional context for better understanding
-
-{search_results}
-
-Based on the web search results above, provide comprehensive research insights in the following JSON format:
-
-{{
-    "topic": "{topic}",
-    "current_trends": [
-        "Current trend 1 with recent evidence from search results",
-        "Current trend 2 with recent evidence from search results"
-    ],
-    "key_statistics": [
-        "Recent statistic 1 with source from search results",
-        "Recent statistic 2 with source from search results"
-    ],
-    "industry_implications": [
-        "Business implication 1 based on current information",
-        "Business implication 2 based on current information"
-    ],
-    "expert_perspectives": [
-        "Recent expert viewpoint 1 from search results",
-        "Recent expert viewpoint 2 from search results"
-    ],
-    "linkedin_angles": [
-        "Angle 1: Why this matters to professionals right now",
-        "Angle 2: How this affects business strategy today",
-        "Angle 3: Current career development implications"
-    ],
-    "supporting_arguments": [
-        "Argument 1 supported by recent developments",
-        "Argument 2 supported by recent developments"
-    ],
-    "potential_controversies": [
-        "Current debate point 1 from recent discussions",
-        "Current debate point 2 from recent discussions"
-    ],
-    "actionable_insights": [
-        "Actionable insight 1 based on current information",
-        "Actionable insight 2 based on current information"
-    ]
-}}
-
-Focus on the most recent information from the search results."""
+CONTEXT: {context[:1000]}
+{search_results}"""
         else:
-            research_prompt = f"""Based on your existing knowledge, conduct comprehensive research on the following topic for LinkedIn content creation:
-
-TOPIC: {topic}
-
-CONTEXT: {context[:1000]}  # Additional context for better understanding
-
-Using your training data and knowledge base, please provide comprehensive research insights in the following JSON format:
-
-{{
-    "topic": "{topic}",
-    "current_trends": [
-        "Current trend 1 related to this topic based on your knowledge",
-        "Current trend 2 related to this topic based on your knowledge"
-    ],
-    "key_statistics": [
-        "Relevant statistic 1 (with approximate source if known)",
-        "Relevant statistic 2 (with approximate source if known)"
-    ],
-    "industry_implications": [
-        "Business implication 1",
-        "Business implication 2"
-    ],
-    "expert_perspectives": [
-        "Expert viewpoint 1 based on known industry opinions",
-        "Expert viewpoint 2 based on known industry opinions"
-    ],
-    "linkedin_angles": [
-        "Angle 1: Why this matters to professionals",
-        "Angle 2: How this affects business strategy",
-        "Angle 3: Career development implications"
-    ],
-    "supporting_arguments": [
-        "Argument 1 supporting main thesis",
-        "Argument 2 supporting main thesis"
-    ],
-    "potential_controversies": [
-        "Debate point 1",
-        "Debate point 2"
-    ],
-    "actionable_insights": [
-        "Actionable insight 1 for readers",
-        "Actionable insight 2 for readers"
-    ]
-}}
-
-Focus on information from your training data that would be valuable for LinkedIn content creation and professional discussion."""
-            research_prompt = f"""Based on your existing knowledge, conduct comprehensive research on the following topic for LinkedIn content creation:
+            research_prompt = f"""{_KNOWLEDGE_RESEARCH_INSTRUCTIONS}
 
 TOPIC: {topic}
 
-CONTEXT: {context[:1000]}  # Additional context for better understanding
-
-Using your training data and knowledge base, please provide comprehensive research insights in the following JSON format:
-
-{{
-    "topic": "{topic}",
-    "current_trends": [
-        "Current trend 1 related to this topic based on your knowledge",
-        "Current trend 2 related to this topic based on your knowledge"
-    ],
-    "key_statistics": [
-        "Relevant statistic 1 (with approximate source if known)",
-        "Relevant statistic 2 (with approximate source if known)"
-    ],
-    "industry_implications": [
-        "Business implication 1",
-        "Business implication 2"
-    ],
-    "expert_perspectives": [
-        "Expert viewpoint 1 based on known industry opinions",
-        "Expert viewpoint 2 based on known industry opinions"
-    ],
-    "linkedin_angles": [
-        "Angle 1: Why this matters to professionals",
-        "Angle 2: How this affects business strategy",
-        "Angle 3: Career development implications"
-    ],
-    "supporting_arguments": [
-        "Argument 1 supporting main thesis",
-        "Argument 2 supporting main thesis"
-    ],
-    "potential_controversies": [
-        "Debate point 1",
-        "Debate point 2"
-    ],
-    "actionable_insights": [
-        "Actionable insight 1 for readers",
-        "Actionable insight 2 for readers"
-    ]
-}}
-
-Focus on information from your training data that would be valuable for LinkedIn content creation and professional discussion."""
+CONTEXT: {context[:1000]}"""
 
         try:
-            response = self.agent(research_prompt)
+            response = await self._create_agent(self._get_pooled_model()).invoke_async(research_prompt)
             
             # Extract response content
             if hasattr(response, 'content'):
@@ -365,9 +425,11 @@ Focus on information from your training data that would be valuable for LinkedIn
                 response_text = str(response)
             
             # Try to parse JSON
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                research_data = json.loads(json_match.group())
+            research_data = extract_json_object(response_text)
+            if research_data is not None:
+                # The JSON template is shared by all topics, so record which topic this is
+                research_data['topic'] = topic
+                self._cache(cache_key, research_data)
             else:
                 # Fallback structure
                 research_data = {
@@ -382,11 +444,11 @@ Focus on information from your training data that would be valuable for LinkedIn
                     'actionable_insights': [f"Stay informed about {topic} developments"]
                 }
             
-            print(f"✅ Research completed for: {topic}")
+            logger.info("✅ Research completed for: %s", topic)
             return research_data
             
         except Exception as e:
-            print(f"❌ Error researching topic '{topic}': {e}")
+            logger.error("❌ Error researching topic '%s': %s", topic, e)
             return {
                 'topic': topic,
                 'current_trends': [],
@@ -411,13 +473,17 @@ Focus on information from your training data that would be valuable for LinkedIn
         Returns:
             Comprehensive research findings for all topics
         """
-        print("🔍 Starting comprehensive topic research...")
+        return self._run_async(self.aconduct_comprehensive_research(instructions, link_analysis))
+    
+    async def aconduct_comprehensive_research(self, instructions: str, link_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Conduct comprehensive research, researching all extracted topics concurrently"""
+        logger.info("🔍 Starting comprehensive topic research...")
         
         # Step 1: Extract topics
-        topics = self.extract_topics(instructions, link_analysis)
+        topics = await self.aextract_topics(instructions, link_analysis)
         
         if not topics:
-            print("ℹ️ No topics identified for research")
+            logger.info("ℹ️ No topics identified for research")
             return {
                 'topics_researched': [],
                 'research_results': {},
@@ -431,12 +497,11 @@ Focus on information from your training data that would be valuable for LinkedIn
                 'summary': 'No specific topics identified for additional research.'
             }
         
-        # Step 2: Research each topic
-        research_results = {}
+        # Step 2: Research each topic. Topics are independent, so their web searches and
+        # model calls run concurrently; gather keeps the results in topic order
         context = f"Instructions: {instructions[:500]}... Link Analysis: {link_analysis.get('summary', '')}"
-        
-        for topic in topics:
-            research_results[topic] = self.research_topic(topic, context)
+        results = await asyncio.gather(*(self.aresearch_topic(topic, context) for topic in topics))
+        research_results = dict(zip(topics, results))
         
         # Step 3: Aggregate insights across all topics
         aggregated_insights = {
@@ -463,12 +528,12 @@ Focus on information from your training data that would be valuable for LinkedIn
             'summary': f'Conducted research on {len(topics)} topics: {", ".join(topics)}. Generated {len(aggregated_insights["all_trends"])} trends, {len(aggregated_insights["all_statistics"])} statistics, and {len(aggregated_insights["all_angles"])} LinkedIn angles.'
         }
         
-        print(f"🔍 Research complete:")
-        print(f"   - Topics researched: {len(topics)}")
-        print(f"   - Trends identified: {len(aggregated_insights['all_trends'])}")
-        print(f"   - Statistics gathered: {len(aggregated_insights['all_statistics'])}")
-        print(f"   - LinkedIn angles: {len(aggregated_insights['all_angles'])}")
-        print(f"   - Actionable insights: {len(aggregated_insights['all_actionable_insights'])}")
+        logger.info("🔍 Research complete:")
+        logger.info("   - Topics researched: %d", len(topics))
+        logger.info("   - Trends identified: %d", len(aggregated_insights['all_trends']))
+        logger.info("   - Statistics gathered: %d", len(aggregated_insights['all_statistics']))
+        logger.info("   - LinkedIn angles: %d", len(aggregated_insights['all_angles']))
+        logger.info("   - Actionable insights: %d", len(aggregated_insights['all_actionable_insights']))
         
         return final_research
 
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Response Cache
+
+Persistent prompt -> response cache for LLM calls, backed by SQLite.
+Lets agents skip the model round-trip when the exact same prompt is sent
+to the same model again (e.g. re-running feedback on an unchanged post).
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    def __init__(self, path: str = ".cache/llm_responses.sqlite"):
+        """Open (or create) the cache database at the given path"""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+            )
+            # Databases created before entries were timestamped
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(responses)")}
+            if "created_at" not in columns:
+                self._connection.execute("ALTER TABLE responses ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+            self._connection.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from everything that determines the response (model, system prompt, prompt...)"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss
+
+        Args:
+            key: Cache key from make_key
+            max_age: Treat entries older than this many seconds as misses
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if not row or (max_age is not None and time.time() - row[1] > max_age):
+            return None
+        return row[0]
+
+    def set(self, key: str, response: str):
+        """Store a response under the given key"""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+            self._connection.commit()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Token Counting
+
+Shared tiktoken helpers for the agents package. Building an encoding parses the whole
+BPE vocabulary, so each model's encoding is loaded once per process and reused.
+tiktoken downloads encodings on first use; when that isn't possible, counts fall back
+to a characters-per-token estimate.
+"""
+
+from functools import lru_cache
+
+import tiktoken
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Rough average for English text, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=8)
+def token_encoding(model_id: str):
+    """Tokenizer for the model, or None if it can't be loaded (tiktoken downloads it on first use)"""
+    try:
+        return tiktoken.encoding_for_model(model_id)
+    except KeyError:
+        # Model unknown to this tiktoken version, so assume the current OpenAI encoding
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning("⚠️ Tokenizer unavailable, estimating tokens from characters: %s", e)
+        return None
+
+
+def count_tokens(text: str, model_id: str) -> int:
+    """Number of tokens the model sees for the text (estimated if the tokenizer is unavailable)"""
+    encoding = token_encoding(model_id)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode_ordinary(text))
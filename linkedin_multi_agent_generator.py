@@ -9,9 +9,14 @@ This system uses specialized agents working in coordination:
 2. ResearchAgent - Conducts topic research
 3. PostCompositionAgent - Generates final posts with style matching
 
-Orchestrated using Strands native workflow system for optimal performance.
+Phases run in dependency order, with link analysis and research running concurrently within each phase.
+
+Results are cached for 24 hours, so re-running with the same instructions returns the same post.
+Pass --no-cache (or set USE_CACHE=false) to generate a fresh draft.
 """
 
+import sys
+
 from agents import LinkedInMultiAgentGenerator
 
 
@@ -28,11 +33,22 @@ def main():
     
     try:
         # Initialize the multi-agent generator
-        generator = LinkedInMultiAgentGenerator()
+        generator = LinkedInMultiAgentGenerator(use_cache=False if "--no-cache" in sys.argv[1:] else None)
         
-        # Generate post using coordinated agents
+        # Generate post using coordinated agents, showing it as it is written
         print("🚀 Starting multi-agent workflow...")
-        final_post = generator.generate_post(use_strands_workflow=False)  # Use sequential by default
+        streamed = []
+        def show_chunk(chunk: str):
+            if not streamed:
+                print("\n" + "="*80)
+                print("🎯 FINAL LINKEDIN POST:")
+                print("="*80)
+            streamed.append(chunk)
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        
+        final_post = generator.generate_post(on_chunk=show_chunk)
+        print("="*80)
         
         # Save the generated post to output file
         import os
@@ -53,11 +69,6 @@ def main():
             print(f"⚠️ Warning: Could not save post to file: {e}")
         
         # Display final results
-        print("\n" + "="*80)
-        print("🎯 FINAL LINKEDIN POST:")
-        print("="*80)
-        print(final_post)
-        print("="*80)
         print(f"📊 Character count: {len(final_post)}")
         
         # Calculate reading time (average 200 words per minute)